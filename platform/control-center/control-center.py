@@ -1,31 +1,80 @@
 #!/usr/bin/env python3
 
-import yaml
+import atexit
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import http.client
+import itertools
 import os
 import sys
 import platform
+import queue
 import subprocess
 import re
 import shutil
 import signal
+import threading
 import time
 import json
-from typing import Optional, List, Dict, Tuple
-from rich.console import Console
+from typing import Optional, List, Dict, FrozenSet, Sequence, Tuple
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
-from rich.live import Live
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
+
+try:
+    # Optional; parses large kubectl/API payloads several times faster than json.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# yaml, rich.live and InquirerPy's prompts are imported where they are first
+# needed, and the Console is only built on first print, to keep start-up cheap.
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_load_all():
+    """yaml.load_all bound to the libyaml-backed loader when PyYAML was built with it."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return functools.partial(yaml.load_all, Loader=loader)
+
+
+@functools.lru_cache(maxsize=None)
+def _console():
+    from rich.console import Console
+    return Console()
+
+
+class _LazyConsole:
+    """Stands in for the shared Console until something is first printed."""
+
+    def __getattr__(self, name):
+        return getattr(_console(), name)
 
 # --- Constants ---
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 # Default to dev environment
 K8S_DIR = os.path.join(REPO_ROOT, "platform", "k8s", "dev")
-CONSOLE = Console()
+CONSOLE = _LazyConsole()
 COMPOSE_FILE = os.path.join(REPO_ROOT, "platform", "docker-compose.yml")
 COMPOSE_ENV = os.path.join(REPO_ROOT, "platform", ".env")
+# Services offered by the compose menus, in display order
+_COMPOSE_SVC_LIST = (
+    "mongodb", "minio", "postgres", "redis", "kafka", "kafka-ui",
+    "scheduling-model", "wolfram-kernel", "hexagon",
+)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "enginedge")
+MANIFEST_CACHE_FILE = os.path.join(CACHE_DIR, "manifests.json")
+BUILD_CACHE_FILE = os.path.join(CACHE_DIR, "build-cache.json")
+IS_WINDOWS = platform.system().lower().startswith("win")
+# Resolved once so every kubectl call skips the PATH search
+_KUBECTL_PATH = shutil.which("kubectl")
+_KUBECTL = _KUBECTL_PATH or "kubectl"
 
 # Global flag for clean shutdown
 shutdown_requested = False
@@ -108,28 +157,111 @@ K8S_SERVICE_GROUPS = {
     }
 }
 
+# Every group, in menu order ("Full Stack" scope)
+_ALL_GROUPS: Tuple[str, ...] = tuple(K8S_SERVICE_GROUPS)
+
+# Deployments that refresh/stop act on for each service group
+GROUP_DEPLOYMENTS: Dict[str, Tuple[str, ...]] = {
+    "Stateful Backend": ("hexagon",),
+    "Core Applications": (
+        "agent-tool-worker", "data-processing-worker", "interview-worker",
+        "latex-worker", "assistant-worker", "resume-worker", "wolfram-kernel", "hexagon",
+    ),
+    "Scheduling App": ("scheduling-model",),
+}
+
+
+def _group_deployments(selected_groups: List[str]) -> List[str]:
+    """Deployments for the selected groups, de-duplicated in order."""
+    return list(dict.fromkeys(d for group in selected_groups for d in GROUP_DEPLOYMENTS.get(group, ())))
+
+
+@functools.lru_cache(maxsize=1)
+def _group_choices() -> tuple:
+    """Menu choices for the service groups; static, so built once on first use."""
+    from InquirerPy.base.control import Choice
+    return tuple(Choice(value=name, name=f"{name}: {data['description']}") for name, data in K8S_SERVICE_GROUPS.items())
+
+
+# Helm chart and values file (relative to K8S_DIR) for each third-party release
+HELM_CHARTS = {
+    "postgres-metastore": "bitnami/postgresql",
+    "minio": "minio/minio",
+    "kafka": "bitnami/kafka",
+    "redis": "bitnami/redis",
+    "kube-prometheus-stack": "prometheus-community/kube-prometheus-stack"
+}
+HELM_VALUES = {
+    "postgres-metastore": "charts/postgres/values.yaml",
+    "minio": "charts/minio/values.yaml",
+    "kafka": "charts/kafka/values.yaml",
+    "redis": "charts/redis/values.yaml",
+    "kube-prometheus-stack": "observability/helm-values.yaml"
+}
+HELM_REPOS = [
+    ("bitnami", "https://charts.bitnami.com/bitnami"),
+    ("minio", "https://charts.min.io/"),
+    ("prometheus-community", "https://prometheus-community.github.io/helm-charts"),
+]
+
 # --- Kubernetes Environment Logic ---
 
-def get_group_resources(selected_groups: List[str]) -> Tuple[List[str], List[str]]:
+@functools.lru_cache(maxsize=None)
+def _resolved_service_groups(k8s_dir: str) -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """K8S_SERVICE_GROUPS with manifest paths made absolute against k8s_dir (resolved once per dir)."""
+    return {
+        group: (
+            tuple(os.path.join(k8s_dir, m) for m in data.get("manifests", [])),
+            tuple(data.get("helm_releases", [])),
+        )
+        for group, data in K8S_SERVICE_GROUPS.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _helm_installs(k8s_dir: str) -> Dict[str, Tuple[str, str]]:
+    """release -> (chart, absolute values file) for releases with both, resolved once per dir."""
+    return {
+        release: (chart, os.path.join(k8s_dir, HELM_VALUES[release]))
+        for release, chart in HELM_CHARTS.items()
+        if release in HELM_VALUES
+    }
+
+
+def get_group_resources(selected_groups: Sequence[str]) -> Tuple[List[str], List[str]]:
     """Collects all manifests and Helm releases from a list of service groups."""
-    manifests = []
-    helm_releases = []
+    # Keyed on K8S_DIR rather than computed at import, since main() switches it for prod.
+    resolved = _resolved_service_groups(K8S_DIR)
+    manifests = set()
+    helm_releases = set()
     for group_name in selected_groups:
-        group_data = K8S_SERVICE_GROUPS.get(group_name, {})
-        for manifest in group_data.get("manifests", []):
-            manifests.append(os.path.join(K8S_DIR, manifest))
-        helm_releases.extend(group_data.get("helm_releases", []))
-    return sorted(list(set(manifests))), sorted(list(set(helm_releases)))
+        entry = resolved.get(group_name)
+        if entry:
+            manifests.update(entry[0])
+            helm_releases.update(entry[1])
+    return sorted(manifests), sorted(helm_releases)
+
 
+# Top-level directories under K8S_DIR; anything else lands in "other".
+_MANIFEST_CATEGORIES = ("secrets", "config", "rbac", "observability", "apps")
 
-def _is_windows() -> bool:
-    return platform.system().lower().startswith("win")
+
+def _categorize_manifests(manifests: List[str]) -> Dict[str, List[str]]:
+    """Buckets manifests by their first directory under K8S_DIR in a single pass, preserving input order."""
+    buckets: Dict[str, List[str]] = {category: [] for category in _MANIFEST_CATEGORIES}
+    buckets["other"] = []
+    prefix_len = len(K8S_DIR) + 1
+    for m in manifests:
+        rel = m[prefix_len:] if m.startswith(K8S_DIR) else os.path.relpath(m, K8S_DIR)
+        category = rel.replace("\\", "/").split("/", 1)[0]
+        buckets[category if category in buckets else "other"].append(m)
+    return buckets
 
 
 def _run_script(script_path: str):
     """Run a script cross-platform: .ps1 via PowerShell on Windows, .sh via bash otherwise."""
     try:
-        if _is_windows():
+        if IS_WINDOWS:
             # Ensure PowerShell execution
             subprocess.run(
                 [
@@ -146,7 +278,7 @@ def _run_script(script_path: str):
             subprocess.run(["bash", script_path], check=True)
     except FileNotFoundError:
         # Fallback to Windows PowerShell if pwsh isn't available
-        if _is_windows():
+        if IS_WINDOWS:
             subprocess.run(
                 [
                     "powershell",
@@ -161,13 +293,25 @@ def _run_script(script_path: str):
 
 
 def _kubectl_available() -> bool:
-    return shutil.which("kubectl") is not None
+    return _KUBECTL_PATH is not None
+
 
+def _print_missing_kubectl():
+    CONSOLE.print(Panel(
+        "[red]kubectl command not found[/red]\n\n"
+        "Please ensure kubectl is installed and available in your PATH.\n"
+        "Visit: https://kubernetes.io/docs/tasks/tools/",
+        title="Missing kubectl",
+        border_style="red"
+    ))
 
+
+@functools.lru_cache(maxsize=None)
 def _helm_available() -> bool:
     return shutil.which("helm") is not None
 
 
+@functools.lru_cache(maxsize=None)
 def _kind_available() -> bool:
     """Check if kind is available, refreshing PATH on Windows if needed."""
     # First try standard check
@@ -175,7 +319,7 @@ def _kind_available() -> bool:
         return True
     
     # On Windows, refresh PATH from user environment
-    if _is_windows():
+    if IS_WINDOWS:
         try:
             import winreg
             # Get user PATH from registry
@@ -206,30 +350,41 @@ def _kind_available() -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=None)
 def _docker_available() -> bool:
     return shutil.which("docker") is not None
 
 
+# Which compose flavour is installed: 'v2' (docker compose), 'v1' (docker-compose)
+# or 'none'. Populated lazily by _detect_compose_mode().
+_COMPOSE_MODE: Optional[str] = None
+
+
+def _detect_compose_mode() -> str:
+    """Probe for docker compose v2, then legacy docker-compose, once per process."""
+    global _COMPOSE_MODE
+    if _COMPOSE_MODE is None:
+        mode = "none"
+        if _docker_available():
+            try:
+                subprocess.run(["docker", "compose", "version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                mode = "v2"
+            except Exception:
+                if shutil.which("docker-compose") is not None:
+                    mode = "v1"
+        _COMPOSE_MODE = mode
+    return _COMPOSE_MODE
+
+
 def _compose_available() -> bool:
     # either 'docker compose' or legacy docker-compose
-    if not _docker_available():
-        return False
-    # Prefer docker compose v2
-    try:
-        subprocess.run(["docker", "compose", "version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except Exception:
-        return shutil.which("docker-compose") is not None
+    return _detect_compose_mode() != "none"
 
 
 def _compose_cmd(base_args: List[str]) -> List[str]:
     # Build a compose command using docker compose if available, else docker-compose
-    if shutil.which("docker"):
-        try:
-            subprocess.run(["docker", "compose", "version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return ["docker", "compose", "-f", COMPOSE_FILE, "--env-file", COMPOSE_ENV] + base_args
-        except Exception:
-            pass
+    if _detect_compose_mode() == "v2":
+        return ["docker", "compose", "-f", COMPOSE_FILE, "--env-file", COMPOSE_ENV] + base_args
     return ["docker-compose", "-f", COMPOSE_FILE, "--env-file", COMPOSE_ENV] + base_args
 
 
@@ -255,22 +410,294 @@ def _ensure_compose_files() -> bool:
     return True
 
 
+def _kubeconfig_stamp() -> Tuple[Tuple[str, int], ...]:
+    """(path, mtime) of each kubeconfig file, so cached clients notice context switches."""
+    paths = os.environ.get("KUBECONFIG") or os.path.join(os.path.expanduser("~"), ".kube", "config")
+    stamp = []
+    for path in paths.split(os.pathsep):
+        try:
+            stamp.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            stamp.append((path, 0))
+    return tuple(stamp)
+
+
+@functools.lru_cache(maxsize=1)
+def _k8s_api_client_for(stamp: Tuple[Tuple[str, int], ...]):
+    try:
+        from kubernetes import client, config
+    except ImportError:
+        return None
+    try:
+        configuration = client.Configuration()
+        config.load_kube_config(client_configuration=configuration)
+        return client.ApiClient(configuration)
+    except Exception:
+        return None
+
+
+def _k8s_api_client():
+    """Shared Kubernetes ApiClient (one connection pool), or None to fall back to kubectl.
+
+    The optional `kubernetes` package avoids forking kubectl (and redoing the
+    kubeconfig parse and TLS handshake) for every read.
+    """
+    return _k8s_api_client_for(_kubeconfig_stamp())
+
+
+# Resource names kubectl understands for each kind we list in the default namespace.
+_KUBECTL_RESOURCES = {
+    "Deployment": "deploy",
+    "StatefulSet": "statefulset",
+    "Pod": "pods",
+    "Service": "svc",
+    "PersistentVolumeClaim": "pvc",
+    "CronJob": "cronjob",
+}
+
+
+# (connect, read) seconds for one-shot client calls, so an unreachable API server
+# fails like a kubectl --request-timeout instead of waiting on the OS TCP timeout.
+_K8S_REQUEST_TIMEOUT = (5, 30)
+
+
+def _k8s_listers(api) -> Dict:
+    from kubernetes import client
+    apps = client.AppsV1Api(api)
+    core = client.CoreV1Api(api)
+    batch = client.BatchV1Api(api)
+    return {
+        "Deployment": apps.list_namespaced_deployment,
+        "StatefulSet": apps.list_namespaced_stateful_set,
+        "Pod": core.list_namespaced_pod,
+        "Service": core.list_namespaced_service,
+        "PersistentVolumeClaim": core.list_namespaced_persistent_volume_claim,
+        "CronJob": batch.list_namespaced_cron_job,
+    }
+
+
+# REST collection paths for the same kinds, used through `kubectl proxy`.
+_API_PATHS = {
+    "Deployment": "/apis/apps/v1/namespaces/default/deployments",
+    "StatefulSet": "/apis/apps/v1/namespaces/default/statefulsets",
+    "Pod": "/api/v1/namespaces/default/pods",
+    "Service": "/api/v1/namespaces/default/services",
+    "PersistentVolumeClaim": "/api/v1/namespaces/default/persistentvolumeclaims",
+    "CronJob": "/apis/batch/v1/namespaces/default/cronjobs",
+}
+
+_kubectl_proxy: Optional[subprocess.Popen] = None
+_kubectl_proxy_conn: Optional[http.client.HTTPConnection] = None
+_kubectl_proxy_stamp: Optional[Tuple[Tuple[str, int], ...]] = None
+_kubectl_proxy_failed: Optional[Tuple[Tuple[str, int], ...]] = None
+_kubectl_proxy_lock = threading.Lock()
+
+
+def _stop_kubectl_proxy():
+    global _kubectl_proxy, _kubectl_proxy_conn
+    if _kubectl_proxy_conn is not None:
+        _kubectl_proxy_conn.close()
+    if _kubectl_proxy is not None and _kubectl_proxy.poll() is None:
+        _kubectl_proxy.terminate()
+        try:
+            _kubectl_proxy.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            _kubectl_proxy.kill()
+    _kubectl_proxy = None
+    _kubectl_proxy_conn = None
+
+
+def _kubectl_proxy_connection() -> Optional[http.client.HTTPConnection]:
+    """Keep-alive connection to a long-lived `kubectl proxy`, started on first use.
+
+    Restarted when the kubeconfig changes; returns None if the proxy cannot be
+    started, in which case callers fall back to forking kubectl per call.
+    """
+    global _kubectl_proxy, _kubectl_proxy_conn, _kubectl_proxy_stamp, _kubectl_proxy_failed
+    stamp = _kubeconfig_stamp()
+    if _kubectl_proxy is not None and (_kubectl_proxy_stamp != stamp or _kubectl_proxy.poll() is not None):
+        _stop_kubectl_proxy()
+    if _kubectl_proxy is None:
+        if _kubectl_proxy_failed == stamp or not _kubectl_available():
+            return None
+        try:
+            proc = subprocess.Popen(
+                [_KUBECTL, "proxy", "--port=0"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            _kubectl_proxy_failed = stamp
+            return None
+        # "Starting to serve on 127.0.0.1:<port>"
+        match = re.search(r":(\d+)\s*$", proc.stdout.readline())
+        if not match:
+            proc.kill()
+            _kubectl_proxy_failed = stamp
+            return None
+        if _kubectl_proxy_stamp is None:
+            atexit.register(_stop_kubectl_proxy)
+        _kubectl_proxy = proc
+        _kubectl_proxy_stamp = stamp
+        _kubectl_proxy_conn = http.client.HTTPConnection("127.0.0.1", int(match.group(1)), timeout=10)
+    return _kubectl_proxy_conn
+
+
+def _kubectl_proxy_request(method: str, path: str, body: Optional[bytes] = None, content_type: Optional[str] = None) -> Optional[Tuple[int, bytes]]:
+    """Send one request through `kubectl proxy`; None if the proxy is unavailable."""
+    headers = {"Accept": "application/json"}
+    if content_type:
+        headers["Content-Type"] = content_type
+    with _kubectl_proxy_lock:
+        conn = _kubectl_proxy_connection()
+        if conn is None:
+            return None
+        for attempt in range(2):
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                return resp.status, resp.read()
+            except (OSError, http.client.HTTPException):
+                # Stale keep-alive socket: close so the next request reconnects.
+                conn.close()
+                if attempt:
+                    raise
+    return None
+
+
+def _kubectl_proxy_get(path: str) -> Optional[Dict]:
+    """GET a path through `kubectl proxy`; None if the proxy is unavailable."""
+    result = _kubectl_proxy_request("GET", path)
+    if result is None:
+        return None
+    status, body = result
+    if status != 200:
+        raise RuntimeError(f"GET {path} returned {status}")
+    return _json_loads(body or b"{}")
+
+
+def _kube_list(kinds: Tuple[str, ...]) -> Dict[str, List[Dict]]:
+    """List resources of the given kinds in the default namespace, grouped by kind.
+
+    Items have the same JSON shape as `kubectl get -o json`. Uses the Python
+    client when available, then a shared `kubectl proxy`, otherwise a single
+    batched `kubectl get`. Raises on failure.
+    """
+    api = _k8s_api_client()
+    if api is not None:
+        listers = _k8s_listers(api)
+
+        def list_kind(kind: str) -> List[Dict]:
+            resp = listers[kind]("default", _preload_content=False, _request_timeout=_K8S_REQUEST_TIMEOUT)
+            return _json_loads(resp.data or b"{}").get("items", []) or []
+
+        if len(kinds) == 1:
+            return {kinds[0]: list_kind(kinds[0])}
+        # The client's urllib3 pool is thread-safe, so per-kind round trips overlap.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            return dict(zip(kinds, executor.map(list_kind, kinds)))
+
+    try:
+        grouped = {}
+        for kind in kinds:
+            data = _kubectl_proxy_get(_API_PATHS[kind])
+            if data is None:
+                break
+            grouped[kind] = data.get("items", []) or []
+        else:
+            return grouped
+    except Exception:
+        pass
+
+    data = _kubectl_json(["get", ",".join(_KUBECTL_RESOURCES[kind] for kind in kinds), "-n", "default"])
+    grouped = {kind: [] for kind in kinds}
+    for item in data.get("items", []):
+        if item.get("kind") in grouped:
+            grouped[item["kind"]].append(item)
+    return grouped
+
+
+# Short-lived cache of read-only listings for the menu (e.g. the service picker).
+# A kind's TTL doubles while its resourceVersions stay the same and drops back to
+# the minimum when they change; mutating menu actions clear it outright.
+_KUBE_LIST_TTL_MIN = 5.0
+_KUBE_LIST_TTL_MAX = 60.0
+_kube_list_cache: Dict[str, Dict] = {}
+
+
+def _invalidate_kube_list_cache():
+    _kube_list_cache.clear()
+
+
+def _kube_list_cached(kinds: Tuple[str, ...]) -> Dict[str, List[Dict]]:
+    """_kube_list for menu lookups that tolerate data a few seconds old."""
+    now = time.monotonic()
+    grouped: Dict[str, List[Dict]] = {}
+    for kind in kinds:
+        entry = _kube_list_cache.get(kind)
+        if entry and now - entry["ts"] < entry["ttl"]:
+            grouped[kind] = entry["items"]
+    missing = tuple(kind for kind in kinds if kind not in grouped)
+    if missing:
+        for kind, items in _kube_list(missing).items():
+            sig = tuple((item.get("metadata") or {}).get("resourceVersion") for item in items)
+            prev = _kube_list_cache.get(kind)
+            ttl = min(prev["ttl"] * 2, _KUBE_LIST_TTL_MAX) if prev and prev["sig"] == sig else _KUBE_LIST_TTL_MIN
+            _kube_list_cache[kind] = {"ts": time.monotonic(), "ttl": ttl, "sig": sig, "items": items}
+            grouped[kind] = items
+    return grouped
+
+
 def _is_cluster_online(timeout_seconds: int = 8) -> bool:
+    """Liveness probe.
+
+    The default allows for a slow remote API server or exec-plugin auth on a
+    one-off check; _wait_for_cluster_online retries with a much shorter timeout.
+    """
+    api = _k8s_api_client()
+    if api is not None:
+        try:
+            from kubernetes import client
+            client.VersionApi(api).get_code(_request_timeout=timeout_seconds, _preload_content=False)
+            return True
+        except Exception:
+            return False
     if not _kubectl_available():
         return False
     try:
         subprocess.run(
-            f"kubectl cluster-info --request-timeout={timeout_seconds}s",
-            shell=True,
+            [_KUBECTL, "cluster-info", f"--request-timeout={timeout_seconds}s"],
             check=True,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            timeout=timeout_seconds + 1,
         )
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False
 
 
+def _wait_for_cluster_online(
+    timeout_seconds: float,
+    initial_delay: float = 0.5,
+    max_delay: float = 8.0,
+    factor: float = 2.0,
+    probe_timeout: int = 2,
+) -> bool:
+    """Probe the cluster until it answers, backing off exponentially between attempts."""
+    deadline = time.monotonic() + timeout_seconds
+    delay = initial_delay
+    while True:
+        if _is_cluster_online(timeout_seconds=probe_timeout):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, max_delay)
+
+
 def _kind_cluster_exists(cluster_name: str) -> bool:
     if not _kind_available():
         return False
@@ -311,7 +738,7 @@ def _ensure_kind_kubeconfig_and_context(cluster_name: str = "enginedge") -> None
     # Switch context if present; ignore errors.
     try:
         subprocess.run(
-            ["kubectl", "config", "use-context", f"kind-{cluster_name}"],
+            [_KUBECTL, "config", "use-context", f"kind-{cluster_name}"],
             check=True,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -322,6 +749,8 @@ def _ensure_kind_kubeconfig_and_context(cluster_name: str = "enginedge") -> None
 
 def _start_kind_cluster_interactive() -> bool:
     """Offer to start a local kind cluster. Returns True if cluster is online after, else False."""
+    from InquirerPy import inquirer
+
     if not _kind_available():
         CONSOLE.print(Panel(
             "[red]kind is not installed[/red]\n\n"
@@ -359,11 +788,9 @@ def _start_kind_cluster_interactive() -> bool:
         except Exception:
             pass
 
-        for _ in range(20):
-            if _is_cluster_online():
-                CONSOLE.print("[green]Cluster is online.[/green]")
-                return True
-            time.sleep(2)
+        if _wait_for_cluster_online(timeout_seconds=40):
+            CONSOLE.print("[green]Cluster is online.[/green]")
+            return True
         CONSOLE.print("[yellow]Cluster exists but kubectl still can't reach it.[/yellow]")
         return False
 
@@ -373,7 +800,7 @@ def _start_kind_cluster_interactive() -> bool:
     kind_cmd = shutil.which("kind") or "kind"
     # On Windows, if still not found, try known WinGet location
     if not kind_cmd or kind_cmd == "kind":
-        if _is_windows():
+        if IS_WINDOWS:
             user_profile = os.environ.get("USERPROFILE", "")
             if user_profile:
                 winget_kind_path = os.path.join(
@@ -399,55 +826,175 @@ def _start_kind_cluster_interactive() -> bool:
         CONSOLE.print(f"[red]Failed to start kind cluster: {e}[/red]")
         return False
 
-    # Wait for cluster to become reachable
-    for _ in range(40):
-        if _is_cluster_online():
-            CONSOLE.print("[green]Cluster is online.[/green]")
-            return True
-        time.sleep(3)
+    # Wait for cluster to become reachable. A freshly created kind cluster either
+    # answers quickly or not at all, so probe often with a short request timeout.
+    if _wait_for_cluster_online(timeout_seconds=120, initial_delay=0.25, max_delay=5.0, factor=1.7):
+        CONSOLE.print("[green]Cluster is online.[/green]")
+        return True
     CONSOLE.print("[yellow]Cluster did not become ready in time.[/yellow]")
     return False
 
 
+# Last positive reachability probe; only "online" is cached so a cluster that was
+# just started is picked up immediately.
+_CLUSTER_ONLINE_TTL = 15.0
+_cluster_online_cache = {"ts": 0.0, "ok": False}
+
+
+def _cluster_recently_online(ttl: float = _CLUSTER_ONLINE_TTL) -> bool:
+    return bool(_cluster_online_cache["ok"]) and time.monotonic() - _cluster_online_cache["ts"] < ttl
+
+
+def _record_cluster_online(ok: bool):
+    # Stamped after the probe returns, so a slow probe doesn't shorten the TTL.
+    _cluster_online_cache["ok"] = ok
+    _cluster_online_cache["ts"] = time.monotonic()
+
+
+def _invalidate_cluster_online_cache():
+    """Forget the cached probe, e.g. after a kubectl call failed."""
+    _cluster_online_cache["ok"] = False
+
+
 def _ensure_cluster_online_or_offer_start() -> bool:
+    # A recent successful probe is trusted without re-exporting the kind kubeconfig.
+    if _cluster_recently_online():
+        return True
     # If kind cluster exists, ensure kubectl is targeting it before checking.
     _ensure_kind_kubeconfig_and_context("enginedge")
-    if _is_cluster_online():
-        return True
-    return _start_kind_cluster_interactive()
+    online = _is_cluster_online() or _start_kind_cluster_interactive()
+    _record_cluster_online(online)
+    return online
 
 
-def _extract_images_from_manifests(manifest_paths: List[str]) -> List[str]:
+def _read_json_cache(path: str) -> Dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_json_cache(path: str, data: Dict):
+    """Write a cache file atomically (best-effort)."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+
+# Images extracted per manifest, keyed by absolute path. Loaded lazily from
+# MANIFEST_CACHE_FILE and written back once at exit if anything changed.
+_manifest_cache: Optional[Dict[str, Dict]] = None
+_manifest_cache_dirty = False
+# Bump whenever _parse_manifest_images changes what it returns; older caches are discarded.
+_MANIFEST_CACHE_VERSION = 2
+
+
+def _load_manifest_cache() -> Dict[str, Dict]:
+    global _manifest_cache, _manifest_cache_dirty
+    if _manifest_cache is None:
+        data = _read_json_cache(MANIFEST_CACHE_FILE)
+        entries = data.get("entries")
+        if data.get("version") == _MANIFEST_CACHE_VERSION and isinstance(entries, dict):
+            _manifest_cache = entries
+        else:
+            _manifest_cache = {}
+            # Rewrite even if nothing is reparsed, so the stale file goes away.
+            _manifest_cache_dirty = bool(data)
+        atexit.register(_save_manifest_cache)
+    return _manifest_cache
+
+
+def _save_manifest_cache():
+    if _manifest_cache_dirty and _manifest_cache is not None:
+        _write_json_cache(MANIFEST_CACHE_FILE, {"version": _MANIFEST_CACHE_VERSION, "entries": _manifest_cache})
+
+
+_IMAGE_KEY_RE = re.compile(rb"^[ \t]*(?:-[ \t]+)?image:", re.M)
+_IMAGE_RE = re.compile(rb"""^[ \t]*(?:-[ \t]+)?image:[ \t]*["']?([A-Za-z0-9._/:@-]+)["']?[ \t]*\r?$""", re.M)
+
+
+def _parse_manifest_images(path: str) -> List[str]:
     images: List[str] = []
-    for path in manifest_paths:
-        if not os.path.exists(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    # Secrets/ConfigMaps never mention an image; skip the YAML parse for them.
+    if b"image:" not in data:
+        return images
+    # Fast path: every image: line is a plain scalar. Anything unusual (templating,
+    # block values, trailing comments) falls through to the YAML walk below.
+    found = _IMAGE_RE.findall(data)
+    if found and len(found) == len(_IMAGE_KEY_RE.findall(data)):
+        return [m.decode().split("@")[0] for m in found]
+    for doc in _yaml_load_all()(data):
+        if not isinstance(doc, dict):
             continue
+        spec = doc.get("spec") or {}
+        # Navigate to pod template if it's a workload
+        if doc.get("kind") in ("Deployment", "StatefulSet", "DaemonSet", "Job", "CronJob"):
+            tpl = spec
+            if doc.get("kind") == "CronJob":
+                tpl = spec.get("jobTemplate", {}).get("spec", {}).get("template", {}).get("spec", {})
+            else:
+                tpl = spec.get("template", {}).get("spec", {})
+            for c in (tpl.get("containers") or []):
+                image = c.get("image")
+                if image:
+                    images.append(image.split("@")[0])
+            for c in (tpl.get("initContainers") or []):
+                image = c.get("image")
+                if image:
+                    images.append(image.split("@")[0])
+    return images
+
+
+def _cached_extract(path: str) -> List[str]:
+    """Return the images referenced by a manifest, reparsing only when (mtime, size) changed."""
+    global _manifest_cache_dirty
+    st = os.stat(path)
+    cache = _load_manifest_cache()
+    entry = cache.get(path)
+    if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+        return entry.get("images", [])
+    images = _parse_manifest_images(path)
+    cache[path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "images": images}
+    _manifest_cache_dirty = True
+    return images
+
+
+def _extract_images_from_manifests(manifest_paths: List[str]) -> List[str]:
+    def _extract_one(path: str) -> List[str]:
         try:
-            with open(path, "r") as f:
-                for doc in yaml.safe_load_all(f):
-                    if not isinstance(doc, dict):
-                        continue
-                    spec = doc.get("spec") or {}
-                    # Navigate to pod template if it's a workload
-                    if doc.get("kind") in ("Deployment", "StatefulSet", "DaemonSet", "Job", "CronJob"):
-                        tpl = spec
-                        if doc.get("kind") == "CronJob":
-                            tpl = spec.get("jobTemplate", {}).get("spec", {}).get("template", {}).get("spec", {})
-                        else:
-                            tpl = spec.get("template", {}).get("spec", {})
-                        for c in (tpl.get("containers") or []):
-                            image = c.get("image")
-                            if image:
-                                images.append(image.split("@")[0])
-                        for c in (tpl.get("initContainers") or []):
-                            image = c.get("image")
-                            if image:
-                                images.append(image.split("@")[0])
+            return _cached_extract(path)
         except Exception:
-            continue
+            return []
+
+    # Load the cache up front so worker threads only read/insert entries.
+    _load_manifest_cache()
+    paths = [p for p in manifest_paths if os.path.exists(p)]
+    images: List[str] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        for found in pool.map(_extract_one, paths):
+            images.extend(found)
     return sorted(list({img for img in images if ":" in img and img.endswith(":latest")}))
 
 
+@functools.lru_cache(maxsize=None)
+def _list_subdirs(parent: str) -> FrozenSet[str]:
+    """Names of the immediate subdirectories of parent (empty if it does not exist)."""
+    try:
+        with os.scandir(parent) as it:
+            return frozenset(e.name for e in it if e.is_dir())
+    except OSError:
+        return frozenset()
+
+
 def _candidate_build_dirs_for_image(image_name: str) -> List[str]:
     # Strip tag
     base = image_name.split(":")[0]
@@ -505,49 +1052,102 @@ def _find_build_context_for_image(image_name: str) -> Optional[str]:
     if image_name.startswith("scheduling-model-api"):
         parent_dir = os.path.dirname(REPO_ROOT)
         sm_root = os.path.join(parent_dir, "enginedge-scheduling-model")
-        if os.path.isfile(os.path.join(sm_root, "Dockerfile")):
+        if "enginedge-scheduling-model" in _list_subdirs(parent_dir) and os.path.isfile(os.path.join(sm_root, "Dockerfile")):
             return sm_root
 
     # Special case: wolfram-kernel lives in sibling repo enginedge-local-kernel (Dockerfile at repo root)
     if image_name.startswith("wolfram-kernel"):
         parent_dir = os.path.dirname(REPO_ROOT)
         lk_root = os.path.join(parent_dir, "enginedge-local-kernel")
-        if os.path.isfile(os.path.join(lk_root, "Dockerfile")):
+        if "enginedge-local-kernel" in _list_subdirs(parent_dir) and os.path.isfile(os.path.join(lk_root, "Dockerfile")):
             return lk_root
     
     # Default: search for Dockerfile in candidate directories
+    # Directory listings are cached so only existing candidates get a Dockerfile stat.
     for cand in _candidate_build_dirs_for_image(image_name):
-        dockerfile_path = os.path.join(cand, "Dockerfile")
-        if os.path.isdir(cand) and os.path.isfile(dockerfile_path):
+        parent, name = os.path.split(cand)
+        if name in _list_subdirs(parent) and os.path.isfile(os.path.join(cand, "Dockerfile")):
             return cand
     
     return None
 
 
+def _build_context_hash(ctx: str, build_cmd: List[str]) -> Optional[str]:
+    """Fingerprint a build context from its files' paths, sizes and mtimes plus the build command.
+
+    Inside a git checkout the file list comes from `git ls-files` (tracked and
+    untracked, honouring .gitignore) so node_modules and build output are skipped.
+    """
+    files: Optional[List[str]] = None
+    try:
+        out = subprocess.run(
+            ["git", "-C", ctx, "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            check=True,
+            capture_output=True,
+        )
+        files = [f for f in out.stdout.decode("utf-8", "surrogateescape").split("\0") if f]
+    except Exception:
+        files = None
+    if files is None:
+        files = []
+        for root, dirs, names in os.walk(ctx):
+            dirs[:] = [d for d in dirs if d not in (".git", "node_modules")]
+            for name in names:
+                files.append(os.path.relpath(os.path.join(root, name), ctx))
+    if not files:
+        return None
+
+    digest = hashlib.sha256("\0".join(build_cmd).encode("utf-8", "surrogateescape"))
+    for rel in sorted(files):
+        try:
+            st = os.stat(os.path.join(ctx, rel))
+        except OSError:
+            continue
+        digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _docker_image_id(tag: str) -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{.Id}}", tag],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+# KEY=value with an optional `export ` prefix. A value is either quoted (kept
+# verbatim, `#` included) or bare, where a `#` at the start or after whitespace
+# begins a comment.
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""("[^"\r\n]*"|'[^'\r\n]*'|[^\r\n]*?)[ \t]*(?:(?<=[ \t=])#[^\r\n]*)?\r?$""",
+    re.M,
+)
+
+
+@functools.lru_cache(maxsize=None)
 def _load_env_file_if_present():
     """Load simple KEY=VALUE pairs from .env.local or .env into os.environ (noop if absent)."""
     for filename in (".env.local", ".env"):
         path = os.path.join(REPO_ROOT, filename)
-        if not os.path.isfile(path):
-            continue
         try:
-            with open(path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and value and key not in os.environ:
-                        os.environ[key] = value
-        except Exception:
-            pass
+            with open(path, "rb") as f:
+                text = f.read().decode("utf-8", "replace")
+        except OSError:
+            continue
+        for key, value in _ENV_LINE_RE.findall(text):
+            if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+                value = value[1:-1]
+            if value:
+                os.environ.setdefault(key, value)
 
 
-def _build_and_load_kind_images(selected_groups: List[str]):
+def _build_and_load_kind_images(selected_groups: Sequence[str]):
     def _kind_nodes(cluster_name: str) -> List[str]:
         try:
             out = subprocess.run(
@@ -604,19 +1204,59 @@ def _build_and_load_kind_images(selected_groups: List[str]):
     # Determine manifests involved for selected groups and extract images
     manifests_to_apply, _ = get_group_resources(selected_groups)
     # Only app manifests (exclude secrets/config)
-    app_manifests = [m for m in manifests_to_apply if "apps/" in m or m.endswith("cronjob.yaml")]
+    app_manifests = _categorize_manifests(manifests_to_apply)["apps"]
     images = _extract_images_from_manifests(app_manifests)
     if not images:
         return
 
     CONSOLE.print(Panel("Building and loading local images into kind (if needed)...", title="Images", border_style="cyan"))
 
+    kind_cmd: Optional[str] = None
+    if _kind_available():
+        # Get the full path to kind if needed
+        kind_cmd = shutil.which("kind") or "kind"
+        # On Windows, if still not found, try known WinGet location
+        if kind_cmd == "kind" and IS_WINDOWS:
+            user_profile = os.environ.get("USERPROFILE", "")
+            if user_profile:
+                winget_kind_path = os.path.join(
+                    user_profile,
+                    r"AppData\Local\Microsoft\WinGet\Packages\Kubernetes.kind_Microsoft.Winget.Source_8wekyb3d8bbwe\kind.exe"
+                )
+                if os.path.exists(winget_kind_path):
+                    kind_cmd = winget_kind_path
+
+    # Builds and loads run on worker threads; keep their console output from interleaving.
+    console_lock = threading.Lock()
+
+    # Current step per image for the live progress table; written by the workers.
+    stages: Dict[str, str] = {}
+
+    def _load_into_kind(tag: str) -> str:
+        """Load a built image into the kind cluster; returns a short status for the summary."""
+        if not kind_cmd:
+            return "built (kind not found, not loaded)"
+        stages[tag] = "loading into kind"
+        try:
+            subprocess.run([kind_cmd, "load", "docker-image", tag, "--name", "enginedge"], check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            with console_lock:
+                CONSOLE.print(f"[yellow]Failed to load {tag} into kind: {(e.stderr or '').strip() or e}[/yellow]")
+            return "load failed"
+        _tag_loaded_image_for_containerd("enginedge", tag)
+        return "loaded"
+
+    results: Dict[str, str] = {}
+    builds: List[Tuple[str, List[str], Optional[str]]] = []
+    # Images that only need loading, with the prefix for their summary status
+    loads: List[Tuple[str, str]] = []
+    build_cache = _read_json_cache(BUILD_CACHE_FILE)
     for image in images:
         # Expect local dev tags like name:latest
         tag = image
         ctx = _find_build_context_for_image(image)
         if not ctx:
-            CONSOLE.print(f"[yellow]No Dockerfile found for image '{image}'. Skipping build.[/yellow]")
+            results[tag] = "skipped (no Dockerfile)"
             continue
         build_cmd = ["docker", "build", "-t", tag]
         # Special handling for hexagon (Dockerfile is in hexagon/Dockerfile)
@@ -628,19 +1268,7 @@ def _build_and_load_kind_images(selected_groups: List[str]):
             # If image already exists locally, skip rebuild and just load into kind
             try:
                 subprocess.run(["docker", "image", "inspect", tag], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                CONSOLE.print(f"[green]{tag} already exists locally. Skipping build.[/green]")
-                if _kind_available():
-                    # Get the full path to kind if needed
-                    kind_cmd = shutil.which("kind") or "kind"
-                    # On Windows, if still not found, try known WinGet location
-                    if not kind_cmd or kind_cmd == "kind":
-                        if _is_windows():
-                            winget_kind_path = r"C:\Users\chris\AppData\Local\Microsoft\WinGet\Packages\Kubernetes.kind_Microsoft.Winget.Source_8wekyb3d8bbwe\kind.exe"
-                            if os.path.exists(winget_kind_path):
-                                kind_cmd = winget_kind_path
-                    subprocess.run([kind_cmd, "load", "docker-image", tag, "--name", "enginedge"], check=True)
-                    _tag_loaded_image_for_containerd("enginedge", tag)
-                    CONSOLE.print(f"[green]Loaded {tag} into kind cluster.[/green]")
+                loads.append((tag, "exists locally, "))
                 continue
             except subprocess.CalledProcessError:
                 pass
@@ -657,175 +1285,389 @@ def _build_and_load_kind_images(selected_groups: List[str]):
                     border_style="blue",
                 ))
         build_cmd.append(ctx)
-        CONSOLE.print(f"[bold]{' '.join(build_cmd)}[/bold]")
-        try:
-            subprocess.run(build_cmd, check=True)
-        except subprocess.CalledProcessError as e:
-            CONSOLE.print(f"[red]Build failed for {tag}: {e}[/red]")
+        # Skip the build when neither the context nor the image changed since our last build.
+        ctx_hash = _build_context_hash(ctx, build_cmd)
+        cached = build_cache.get(tag)
+        if ctx_hash and isinstance(cached, list) and cached[0] == ctx_hash and cached[1] == _docker_image_id(tag):
+            loads.append((tag, "unchanged, "))
             continue
+        builds.append((tag, build_cmd, ctx_hash))
+
+    def _build_then_load(tag: str, build_cmd: List[str], ctx_hash: Optional[str]) -> str:
+        stages[tag] = "building"
+        try:
+            proc = subprocess.run(build_cmd, capture_output=True, text=True)
+        except OSError as e:
+            with console_lock:
+                CONSOLE.print(f"[red]Build failed for {tag}: {e}[/red]")
+            return "build failed"
+        if proc.returncode != 0:
+            output_tail = "\n".join(((proc.stdout or "") + (proc.stderr or "")).strip().splitlines()[-20:])
+            with console_lock:
+                CONSOLE.print(Panel(output_tail, title=f"Build failed: {tag}", border_style="red"))
+            return "build failed"
+        image_id = _docker_image_id(tag)
+        if ctx_hash and image_id:
+            build_cache[tag] = [ctx_hash, image_id]
+        return _load_into_kind(tag)
+
+    if builds:
+        CONSOLE.print(f"[bold]Building {len(builds)} image(s): {', '.join(tag for tag, _, _ in builds)}[/bold]")
+    if builds or loads:
+        # Independent contexts build side by side (one worker per core); each image is
+        # loaded into kind as soon as its own build finishes.
+        from rich.live import Live
+
+        stages.update((tag, "queued") for tag, _, _ in builds)
+        stages.update((tag, "queued") for tag, _ in loads)
+
+        def render_progress() -> Panel:
+            table = Table(show_header=True, header_style="bold")
+            table.add_column("Image")
+            table.add_column("Status")
+            for tag, stage in stages.items():
+                table.add_row(tag, results.get(tag) or f"[cyan]{stage}...[/cyan]")
+            return Panel(table, title="Building images", border_style="cyan")
+
+        workers = max(1, min(os.cpu_count() or 1, len(builds) + len(loads)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor, \
+                Live(get_renderable=render_progress, refresh_per_second=4, transient=True):
+            futures = {
+                executor.submit(_build_then_load, tag, build_cmd, ctx_hash): (tag, "")
+                for tag, build_cmd, ctx_hash in builds
+            }
+            futures.update({executor.submit(_load_into_kind, tag): (tag, prefix) for tag, prefix in loads})
+            for future in concurrent.futures.as_completed(futures):
+                tag, prefix = futures[future]
+                results[tag] = prefix + future.result()
+        if builds:
+            _write_json_cache(BUILD_CACHE_FILE, build_cache)
+
+    summary = Table(show_header=True, header_style="bold")
+    summary.add_column("Image")
+    summary.add_column("Result")
+    for tag in images:
+        status = results.get(tag, "")
+        style = "red" if "failed" in status else ("yellow" if status.startswith("skipped") or "not loaded" in status else "green")
+        summary.add_row(tag, f"[{style}]{status}[/{style}]")
+    CONSOLE.print(Panel(summary, title="Image build summary", border_style="cyan"))
+
+
+def _deployments_wait_cmd(names: Optional[List[str]], timeout_seconds: int) -> List[str]:
+    """One `kubectl wait` for the given deployments (all in the namespace when names is None)."""
+    targets = [f"deployment/{n}" for n in names] if names is not None else ["deploy", "--all"]
+    return [_KUBECTL, "wait", "--for=condition=Available", *targets, f"--timeout={timeout_seconds}s", "-n", "default"]
+
+
+def _wait_deployments_rolled_out(names: List[str], timeout_seconds: int = 300) -> bool:
+    """Block until every named deployment has finished its rollout.
+
+    A deployment stays Available while old pods serve a rolling update, so
+    `kubectl wait --for=condition=Available` would return at once after a restart.
+    `rollout status` takes one resource per call; the calls run in parallel.
+    """
+    def rolled_out(name: str) -> bool:
+        try:
+            return subprocess.run(
+                [_KUBECTL, "rollout", "status", f"deployment/{name}", f"--timeout={timeout_seconds}s", "-n", "default"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            ).returncode == 0
+        except OSError:
+            return False
+
+    if not names:
+        return True
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
+        return all(list(executor.map(rolled_out, names)))
+
+
+def _kubectl_json(args: List[str]) -> Dict:
+    """Run `kubectl <args> -o json` once and return the decoded payload."""
+    result = subprocess.run(
+        [_KUBECTL, *args, "-o", "json"],
+        check=True,
+        capture_output=True,
+    )
+    # Parsed straight from bytes; no intermediate str decode.
+    return _json_loads(result.stdout or b"{}")
+
 
-        if _kind_available():
-            try:
-                # Get the full path to kind if needed
-                kind_cmd = shutil.which("kind") or "kind"
-                # On Windows, if still not found, try known WinGet location
-                if not kind_cmd or kind_cmd == "kind":
-                    if _is_windows():
-                        user_profile = os.environ.get("USERPROFILE", "")
-                        if user_profile:
-                            winget_kind_path = os.path.join(
-                                user_profile,
-                                r"AppData\Local\Microsoft\WinGet\Packages\Kubernetes.kind_Microsoft.Winget.Source_8wekyb3d8bbwe\kind.exe"
-                            )
-                            if os.path.exists(winget_kind_path):
-                                kind_cmd = winget_kind_path
-                
-                subprocess.run([kind_cmd, "load", "docker-image", tag, "--name", "enginedge"], check=True)
-                _tag_loaded_image_for_containerd("enginedge", tag)
-                CONSOLE.print(f"[green]Loaded {tag} into kind cluster.[/green]")
-            except subprocess.CalledProcessError as e:
-                CONSOLE.print(f"[yellow]Failed to load {tag} into kind: {e}[/yellow]")
-        else:
-            CONSOLE.print("[yellow]kind not found; skipping image load.[/yellow]")
 def wait_for_readiness(timeout_seconds: int = 600):
     """Live readiness watcher for Deployments and StatefulSets in the default namespace."""
+    from rich.live import Live
+
     CONSOLE.print("\n[bold]Waiting for resources to become Ready...[/bold]")
 
-    def load_statuses() -> List[Dict]:
-        statuses: List[Dict] = []
+    def load_state() -> Dict[str, List[Dict]]:
+        """Fetch deployments, statefulsets and pods in one round of API reads."""
         try:
-            dep_out = subprocess.run([
-                "kubectl", "get", "deploy", "-n", "default", "-o", "json"
-            ], check=True, capture_output=True, text=True)
-            dep_data = json.loads(dep_out.stdout or "{}")
-            for item in dep_data.get("items", []):
-                name = item.get("metadata", {}).get("name")
-                replicas = item.get("spec", {}).get("replicas", 1)
-                ready = item.get("status", {}).get("readyReplicas", 0) or 0
-                statuses.append({
-                    "kind": "Deployment",
-                    "name": name,
-                    "ready": int(ready),
-                    "replicas": int(replicas),
-                })
+            return _kube_list(("Deployment", "StatefulSet", "Pod"))
         except Exception:
-            pass
+            return {}
 
-        try:
-            st_out = subprocess.run([
-                "kubectl", "get", "statefulset", "-n", "default", "-o", "json"
-            ], check=True, capture_output=True, text=True)
-            st_data = json.loads(st_out.stdout or "{}")
-            for item in st_data.get("items", []):
+    def summarize(grouped: Dict[str, List[Dict]]) -> Tuple[List[Dict], Dict[str, int], Dict[str, str]]:
+        statuses: List[Dict] = []
+        # Quick lookup of pod restarts and bad statuses per owner
+        restarts_map: Dict[str, int] = {}
+        owner_reason_map: Dict[str, str] = {}
+
+        for kind in ("Deployment", "StatefulSet"):
+            for item in grouped.get(kind, []):
                 name = item.get("metadata", {}).get("name")
                 replicas = item.get("spec", {}).get("replicas", 1)
                 ready = item.get("status", {}).get("readyReplicas", 0) or 0
                 statuses.append({
-                    "kind": "StatefulSet",
+                    "kind": kind,
                     "name": name,
                     "ready": int(ready),
                     "replicas": int(replicas),
                 })
-        except Exception:
-            pass
 
-        return statuses
+        for pod in grouped.get("Pod", []):
+            restarts = 0
+            for cs in pod.get("status", {}).get("containerStatuses", []) or []:
+                restarts += int(cs.get("restartCount", 0))
+                st = cs.get("state", {})
+                if "waiting" in st:
+                    reason = st["waiting"].get("reason") or "waiting"
+                    if reason not in ["ContainerCreating", "PodInitializing"]:
+                        owner_reason_map[pod.get("metadata", {}).get("name", "")] = reason
+                if "terminated" in st:
+                    reason = st["terminated"].get("reason") or "terminated"
+                    owner_reason_map[pod.get("metadata", {}).get("name", "")] = reason
+            owner = None
+            for ref in pod.get("metadata", {}).get("ownerReferences", []) or []:
+                if ref.get("kind") in ("ReplicaSet", "StatefulSet"):
+                    owner = ref.get("name", "")
+            # Map restarts to owning controller name prefix
+            if owner:
+                # Trim ReplicaSet hash to deployment name
+                if "-" in owner:
+                    owner_prefix = owner.split("-")[0]
+                else:
+                    owner_prefix = owner
+                restarts_map[owner_prefix] = restarts_map.get(owner_prefix, 0) + restarts
+                # If this pod had a problematic reason, carry it to owner prefix (first one wins)
+                pod_reason = owner_reason_map.get(pod.get("metadata", {}).get("name", ""))
+                if pod_reason and owner_prefix not in owner_reason_map:
+                    owner_reason_map[owner_prefix] = pod_reason
+
+        return statuses, restarts_map, owner_reason_map
+
+    def render(statuses: List[Dict], restarts_map: Dict[str, int], owner_reason_map: Dict[str, str], elapsed: int) -> Tuple[Panel, int, int]:
+        table = Table(show_header=True, header_style="bold", expand=True)
+        table.add_column("Kind", no_wrap=True)
+        table.add_column("Name")
+        table.add_column("Ready", justify="right", no_wrap=True)
+        table.add_column("Desired", justify="right", no_wrap=True)
+        table.add_column("Errors", justify="left")
+
+        ready_count = 0
+        total = 0
+        for s in sorted(statuses, key=lambda x: (x["kind"], x["name"])):
+            total += 1
+            is_ready = s["ready"] >= s["replicas"] and s["replicas"] > 0
+            if is_ready:
+                ready_count += 1
+            # Aggregate errors by matching pod owner prefix to resource name
+            owner_prefix = s["name"]
+            restart_count = restarts_map.get(owner_prefix, 0)
+            reason = owner_reason_map.get(owner_prefix)
+            err_badges = []
+            if reason:
+                err_badges.append(str(reason))
+            if restart_count > 0:
+                err_badges.append(f"restarts:{restart_count}")
+            # Format with color if any issue
+            if err_badges:
+                err_text = Text(", ".join(err_badges), style="red")
+            else:
+                err_text = Text("")
+            table.add_row(
+                s["kind"],
+                s["name"],
+                str(s["ready"]),
+                str(s["replicas"]),
+                err_text,
+            )
 
-    start = time.time()
-    with Live(refresh_per_second=8, transient=True) as live:
-        while True:
-            statuses = load_statuses()
-            table = Table(show_header=True, header_style="bold", expand=True)
-            table.add_column("Kind", no_wrap=True)
-            table.add_column("Name")
-            table.add_column("Ready", justify="right", no_wrap=True)
-            table.add_column("Desired", justify="right", no_wrap=True)
-            table.add_column("Errors", justify="left")
-
-            ready_count = 0
-            total = 0
-            # Build a quick lookup of pod restarts and bad statuses per owner
-            restarts_map: Dict[str, int] = {}
-            owner_reason_map: Dict[str, str] = {}
+        title = f"Readiness {ready_count}/{total} ready • {elapsed}s elapsed"
+        return Panel(table, title=title, border_style="cyan"), ready_count, total
+
+    def watch_until_ready(api):
+        """Keep one watch per kind open and redraw only when the API server pushes a change."""
+        from kubernetes import watch
+
+        listers = _k8s_listers(api)
+        kinds = ("Deployment", "StatefulSet", "Pod")
+        # kind -> name -> object, seeded from a list and then kept current by watch events
+        objects: Dict[str, Dict[str, Dict]] = {}
+        events: "queue.Queue[Tuple[str, str, Dict]]" = queue.Queue()
+        watchers: List = []
+        stopping = threading.Event()
+        resyncs = {kind: 0 for kind in kinds}
+
+        def pump(kind: str, resource_version: str):
+            w = watch.Watch()
+            watchers.append(w)
             try:
-                pods_out = subprocess.run([
-                    "kubectl", "get", "pods", "-n", "default", "-o", "json"
-                ], check=True, capture_output=True, text=True)
-                pods_data = json.loads(pods_out.stdout or "{}")
-                for pod in pods_data.get("items", []):
-                    restarts = 0
-                    phase = pod.get("status", {}).get("phase", "")
-                    for cs in pod.get("status", {}).get("containerStatuses", []) or []:
-                        restarts += int(cs.get("restartCount", 0))
-                        st = cs.get("state", {})
-                        if "waiting" in st:
-                            reason = st["waiting"].get("reason") or "waiting"
-                            if reason not in ["ContainerCreating", "PodInitializing"]:
-                                owner_reason_map[pod.get("metadata", {}).get("name", "")] = reason
-                        if "terminated" in st:
-                            reason = st["terminated"].get("reason") or "terminated"
-                            owner_reason_map[pod.get("metadata", {}).get("name", "")] = reason
-                    owner = None
-                    for ref in pod.get("metadata", {}).get("ownerReferences", []) or []:
-                        if ref.get("kind") in ("ReplicaSet", "StatefulSet"):
-                            owner = ref.get("name", "")
-                    # Map restarts to owning controller name prefix
-                    if owner:
-                        # Trim ReplicaSet hash to deployment name
-                        if "-" in owner:
-                            owner_prefix = owner.split("-")[0]
-                        else:
-                            owner_prefix = owner
-                        restarts_map[owner_prefix] = restarts_map.get(owner_prefix, 0) + restarts
-                        # If this pod had a problematic reason, carry it to owner prefix (first one wins)
-                        pod_reason = owner_reason_map.get(pod.get("metadata", {}).get("name", ""))
-                        if pod_reason and owner_prefix not in owner_reason_map:
-                            owner_reason_map[owner_prefix] = pod_reason
+                for event in w.stream(
+                    listers[kind],
+                    namespace="default",
+                    resource_version=resource_version,
+                    timeout_seconds=timeout_seconds,
+                ):
+                    obj = event.get("object")
+                    if event.get("type") == "ERROR":
+                        # e.g. 410 Gone: our resourceVersion is too old to resume from
+                        break
+                    if event.get("type") in ("ADDED", "MODIFIED", "DELETED") and obj is not None:
+                        events.put((event["type"], kind, api.sanitize_for_serialization(obj)))
             except Exception:
                 pass
+            # Stream ended, expired or dropped: have the main loop re-list and re-watch.
+            if not stopping.is_set():
+                events.put(("RESYNC", kind, {}))
 
-            for s in sorted(statuses, key=lambda x: (x["kind"], x["name"])):
-                total += 1
-                is_ready = s["ready"] >= s["replicas"] and s["replicas"] > 0
-                if is_ready:
-                    ready_count += 1
-                # Aggregate errors by matching pod owner prefix to resource name
-                owner_prefix = s["name"]
-                restart_count = restarts_map.get(owner_prefix, 0)
-                reason = owner_reason_map.get(owner_prefix)
-                err_badges = []
-                if reason:
-                    err_badges.append(str(reason))
-                if restart_count > 0:
-                    err_badges.append(f"restarts:{restart_count}")
-                # Format with color if any issue
-                if err_badges:
-                    err_text = Text(", ".join(err_badges), style="red")
-                else:
-                    err_text = Text("")
-                table.add_row(
-                    s["kind"],
-                    s["name"],
-                    str(s["ready"]),
-                    str(s["replicas"]),
-                    err_text,
-                )
+        def list_and_watch(kind: str):
+            resp = listers[kind]("default", _preload_content=False, _request_timeout=_K8S_REQUEST_TIMEOUT)
+            data = _json_loads(resp.data or b"{}")
+            objects[kind] = {i.get("metadata", {}).get("name", ""): i for i in data.get("items", []) or []}
+            version = data.get("metadata", {}).get("resourceVersion", "")
+            threading.Thread(target=pump, args=(kind, version), daemon=True).start()
 
-            elapsed = int(time.time() - start)
-            title = f"Readiness {ready_count}/{total} ready • {elapsed}s elapsed"
-            live.update(Panel(table, title=title, border_style="cyan"))
+        for kind in kinds:
+            list_and_watch(kind)
 
-            if total > 0 and ready_count == total:
-                break
-            if time.time() - start >= timeout_seconds:
-                break
-            time.sleep(1)
+        try:
+            with Live(refresh_per_second=8, transient=True) as live:
+                while True:
+                    elapsed = int(time.time() - start)
+                    grouped = {kind: list(objects[kind].values()) for kind in kinds}
+                    panel, ready_count, total = render(*summarize(grouped), elapsed)
+                    live.update(panel)
+                    if total > 0 and ready_count == total:
+                        break
+                    remaining = timeout_seconds - (time.time() - start)
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch = [events.get(timeout=min(1.0, remaining))]
+                    except queue.Empty:
+                        continue
+                    # Coalesce bursts (e.g. a rollout touching many pods) into one redraw.
+                    window_end = time.monotonic() + 0.1
+                    while True:
+                        wait_for = window_end - time.monotonic()
+                        if wait_for <= 0:
+                            break
+                        try:
+                            batch.append(events.get(timeout=wait_for))
+                        except queue.Empty:
+                            break
+                    resync = set()
+                    for event_type, kind, obj in batch:
+                        if event_type == "RESYNC":
+                            resync.add(kind)
+                            continue
+                        name = obj.get("metadata", {}).get("name", "")
+                        if event_type == "DELETED":
+                            objects[kind].pop(name, None)
+                        else:
+                            objects[kind][name] = obj
+                    for kind in resync:
+                        resyncs[kind] += 1
+                        if resyncs[kind] > 5:
+                            # Raising hands over to poll_until_ready in the caller.
+                            raise RuntimeError(f"{kind} watch keeps failing")
+                        list_and_watch(kind)
+        finally:
+            stopping.set()
+            for w in watchers:
+                w.stop()
+
+    def poll_until_ready():
+        # Termination is driven by server-side waits (kubectl wait / rollout status
+        # long-poll the API server); the table below is only refreshed for display.
+        waiter_procs: List[subprocess.Popen] = []
+        waiter_results: Dict[str, int] = {}
+        waiters_done = threading.Event()
+
+        def run_waiter(key: str, commands: List[List[str]]):
+            rc = 0
+            for cmd in commands:
+                if shutdown_requested:
+                    rc = 1
+                    break
+                try:
+                    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except OSError:
+                    rc = 1
+                    break
+                waiter_procs.append(proc)
+                rc = proc.wait()
+                if rc != 0:
+                    break
+            waiter_results[key] = rc
+            if len(waiter_results) == 2 and all(code == 0 for code in waiter_results.values()):
+                waiters_done.set()
+
+        state = summarize(load_state())
+        statefulsets = [s["name"] for s in state[0] if s["kind"] == "StatefulSet"]
+        waiters = [
+            threading.Thread(
+                target=run_waiter,
+                args=("Deployment", [_deployments_wait_cmd(None, timeout_seconds)]),
+                daemon=True,
+            ),
+            # StatefulSets expose no Ready condition; rollout status watches them instead.
+            threading.Thread(
+                target=run_waiter,
+                args=("StatefulSet", [
+                    [_KUBECTL, "rollout", "status", f"statefulset/{name}", f"--timeout={timeout_seconds}s", "-n", "default"]
+                    for name in statefulsets
+                ]),
+                daemon=True,
+            ),
+        ]
+        for t in waiters:
+            t.start()
+
+        try:
+            with Live(refresh_per_second=8, transient=True) as live:
+                while True:
+                    elapsed = int(time.time() - start)
+                    panel, ready_count, total = render(*state, elapsed)
+                    live.update(panel)
+
+                    if waiters_done.is_set() or (total > 0 and ready_count == total):
+                        break
+                    if time.time() - start >= timeout_seconds:
+                        break
+                    waiters_done.wait(2)
+                    state = summarize(load_state())
+        finally:
+            for proc in waiter_procs:
+                if proc.poll() is None:
+                    proc.terminate()
+
+    start = time.time()
+    api = _k8s_api_client()
+    watched = False
+    if api is not None:
+        try:
+            watch_until_ready(api)
+            watched = True
+        except Exception:
+            watched = False
+    if not watched:
+        poll_until_ready()
 
     # Show final pods summary (single block)
     try:
         result = subprocess.run(
-            "kubectl get pods --namespace default -o wide",
-            shell=True,
+            [_KUBECTL, "get", "pods", "--namespace", "default", "-o", "wide"],
             check=True,
             capture_output=True,
             text=True,
@@ -836,32 +1678,92 @@ def wait_for_readiness(timeout_seconds: int = 600):
 
 
 def _list_services() -> List[Dict]:
-    """Return list of services in default namespace with names and ports."""
+    """Return list of services in default namespace with names, ports and pod selector."""
     try:
-        result = subprocess.run(
-            ["kubectl", "get", "svc", "-n", "default", "-o", "json"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        data = json.loads(result.stdout)
-        items = data.get("items", [])
+        items = _kube_list_cached(("Service",))["Service"]
         services = []
         for item in items:
             name = item.get("metadata", {}).get("name")
-            ports = item.get("spec", {}).get("ports", [])
-            services.append({"name": name, "ports": ports})
+            spec = item.get("spec", {})
+            services.append({"name": name, "ports": spec.get("ports", []), "selector": spec.get("selector") or {}})
         return services
     except Exception:
         return []
 
 
+@functools.lru_cache(maxsize=64)
+def _selector_string(selector: Tuple[Tuple[str, str], ...]) -> str:
+    """`k=v,...` label selector, memoized since the same services are picked repeatedly."""
+    # Label keys and values are always strings, so "=".join formats each pair in C.
+    return ",".join(map("=".join, selector))
+
+
+def _follow_logs(cmd: List[str], title: str) -> Optional[int]:
+    """Follow a `logs -f` command in a live view titled `title` until it ends or Ctrl+C.
+
+    A daemon thread drains the child's output into a bounded ring buffer while the
+    main thread redraws its tail at 10 Hz, so bursts of log lines never stall the
+    console. Ctrl+C only stops the view (the module-wide handler would exit the
+    control center), returning None; otherwise returns the exit code. The child is
+    always reaped.
+    """
+    from rich.live import Live
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True, errors="replace")
+    lines: collections.deque = collections.deque(maxlen=10000)
+    lines_lock = threading.Lock()
+
+    def drain():
+        for line in proc.stdout:
+            with lines_lock:
+                lines.append(line.rstrip("\n"))
+
+    def render() -> Panel:
+        height = max(5, shutil.get_terminal_size().lines - 4)
+        with lines_lock:
+            tail = list(itertools.islice(reversed(lines), height))
+        return Panel(Text("\n".join(reversed(tail))), title=Text(f"{title} (Ctrl+C to stop)"), border_style="cyan")
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    previous_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        with Live(get_renderable=render, refresh_per_second=10):
+            # The reader hits EOF once the child exits, so this also waits for the last lines.
+            while reader.is_alive():
+                reader.join(timeout=0.1)
+        return proc.wait()
+    except KeyboardInterrupt:
+        return None
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        reader.join(timeout=1)
+        proc.stdout.close()
+
+
+def _parse_port(value) -> Optional[int]:
+    """A TCP port from an int or an ASCII-digit string, or None if not in 1-65535."""
+    if isinstance(value, str):
+        value = value.strip()
+        # isdecimal alone would let through non-ASCII digits such as Arabic-Indic ones
+        value = int(value) if value.isascii() and value.isdecimal() else None
+    if isinstance(value, int) and not isinstance(value, bool) and 1 <= value <= 65535:
+        return value
+    return None
+
+
 def _start_port_forward(service_name: str, local_port: int, target_port: int):
     """Start kubectl port-forward in background and log to file."""
     log_name = f"port-forward_{service_name}_{local_port}.log"
     log_path = os.path.join(REPO_ROOT, log_name)
     cmd = [
-        "kubectl",
+        _KUBECTL,
         "port-forward",
         f"svc/{service_name}",
         f"{local_port}:{target_port}",
@@ -870,7 +1772,7 @@ def _start_port_forward(service_name: str, local_port: int, target_port: int):
     ]
     try:
         with open(log_path, "w") as log_file:
-            if _is_windows():
+            if IS_WINDOWS:
                 DETACHED_PROCESS = 0x00000008
                 subprocess.Popen(cmd, stdout=log_file, stderr=log_file, creationflags=DETACHED_PROCESS)
             else:
@@ -883,7 +1785,143 @@ def _start_port_forward(service_name: str, local_port: int, target_port: int):
     except Exception as e:
         CONSOLE.print(f"[red]Failed to start port-forward: {e}[/red]")
 
-def generate_k8s_deploy_script(selected_groups: List[str]):
+def _script_inputs_hash(manifests: List[str], *params) -> str:
+    """Fingerprint of everything a generated script depends on: params, manifest stats and this generator."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(repr((K8S_DIR, params)).encode())
+    for path in [__file__, *manifests]:
+        try:
+            st = os.stat(path)
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            h.update(f"{path}\0missing\n".encode())
+    return h.hexdigest()
+
+
+def _scripts_up_to_date(paths: List[str], header: str) -> bool:
+    """True if every script exists and carries `header` in its first two lines."""
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                head = f.readline() + f.readline()
+        except OSError:
+            return False
+        if header not in head:
+            return False
+    return True
+
+
+def _write_script(path: str, lines: List[str], crlf: bool = False):
+    """Encode the whole script once and write it with a single buffered call."""
+    data = "".join(lines)
+    if crlf:
+        data = data.replace("\n", "\r\n")
+    with open(path, "wb", buffering=65536) as f:
+        f.write(data.encode("utf-8"))
+
+
+def _kubectl_apply_sh(manifests: List[str]) -> str:
+    """One `kubectl apply` for a whole phase; kubectl accepts repeated -f flags."""
+    return "kubectl apply" + "".join(f" \\\n  -f {m}" for m in manifests) + "\n"
+
+
+def _kubectl_apply_ps1(manifests: List[str]) -> str:
+    return "kubectl apply " + " ".join(f"-f '{m}'" for m in manifests) + "\n"
+
+
+def _kubectl_delete_sh(targets: List[str], namespace: Optional[str] = None) -> str:
+    """One `kubectl delete` for a whole phase; targets are `-f <file>` or `<type>/<name>` args."""
+    ns = f" -n {namespace}" if namespace else ""
+    return f"kubectl delete{ns} --ignore-not-found=true" + "".join(f" \\\n  {t}" for t in targets) + "\n"
+
+
+def _kubectl_delete_ps1(targets: List[str], namespace: Optional[str] = None) -> str:
+    ns = f" -n {namespace}" if namespace else ""
+    return f"kubectl delete{ns} --ignore-not-found=true " + " ".join(targets) + "\n"
+
+
+def _apply_manifests_stream(manifests: List[str]) -> bool:
+    """Apply manifests with one `kubectl apply -f -`, streaming them over stdin as a multi-doc YAML."""
+    if not manifests:
+        return True
+    try:
+        proc = subprocess.Popen([_KUBECTL, "apply", "-f", "-"], stdin=subprocess.PIPE)
+    except OSError as e:
+        CONSOLE.print(f"[red]Failed to run kubectl: {e}[/red]")
+        return False
+    try:
+        for path in manifests:
+            with open(path, "rb") as f:
+                data = f.read()
+            proc.stdin.write(b"---\n" + data + (b"" if data.endswith(b"\n") else b"\n"))
+        proc.stdin.close()
+    except OSError as e:
+        CONSOLE.print(f"[red]Failed to stream manifests to kubectl: {e}[/red]")
+        proc.kill()
+    return proc.wait() == 0
+
+
+def deploy_k8s_live(selected_groups: List[str]) -> bool:
+    """Deploy the selected groups directly (same phases as the generated deploy script)."""
+    manifests_to_apply, helm_releases_to_install = get_group_resources(selected_groups)
+    if not manifests_to_apply and not helm_releases_to_install:
+        CONSOLE.print("[yellow]No resources found for the selected groups.[/yellow]")
+        return False
+
+    buckets = _categorize_manifests(manifests_to_apply)
+    CONSOLE.print(f"\n[bold]Deploying: {', '.join(selected_groups)}...[/bold]")
+
+    def apply_phase(title: str, manifests: List[str]) -> bool:
+        if not manifests:
+            return True
+        CONSOLE.print(f"[cyan]--- {title} ---[/cyan]")
+        if _apply_manifests_stream(manifests):
+            return True
+        CONSOLE.print(f"[red]Deploy failed while {title[0].lower() + title[1:]}.[/red]")
+        _invalidate_cluster_online_cache()
+        return False
+
+    if not apply_phase("Applying Secrets and ConfigMaps", buckets["config"] + buckets["secrets"]):
+        return False
+    if not apply_phase("Applying RBAC Resources", buckets["rbac"]):
+        return False
+
+    if helm_releases_to_install:
+        CONSOLE.print("[cyan]--- Installing Helm Charts for 3rd party services ---[/cyan]")
+        try:
+            for name, url in HELM_REPOS:
+                subprocess.run(["helm", "repo", "add", name, url], check=True)
+            subprocess.run(["helm", "repo", "update"], check=True)
+            installs = _helm_installs(K8S_DIR)
+            for release in helm_releases_to_install:
+                if release in installs:
+                    chart, values = installs[release]
+                    subprocess.run(
+                        ["helm", "upgrade", "--install", release, chart, "-f", values, "--namespace", "default"],
+                        check=True,
+                    )
+        except (OSError, subprocess.CalledProcessError) as e:
+            CONSOLE.print(f"[red]Deploy failed while installing Helm charts: {e}[/red]")
+            _invalidate_cluster_online_cache()
+            return False
+
+    if not apply_phase("Applying Observability Manifests", buckets["observability"]):
+        return False
+    if not apply_phase("Deploying Core Applications", buckets["apps"]):
+        return False
+
+    CONSOLE.print("[bold green]Kubernetes deployment finished.[/bold green]")
+    return True
+
+
+def _script_name_part(selected_groups: List[str]) -> str:
+    """File-name fragment shared by the deploy/destroy scripts of a group selection."""
+    if len(selected_groups) == len(K8S_SERVICE_GROUPS):
+        return "all"
+    return "_".join(group.split()[0].lower() for group in selected_groups)
+
+
+def generate_k8s_deploy_script(selected_groups: List[str], script_part: Optional[str] = None):
     """Generates deploy scripts (.sh and .ps1) for the selected Kubernetes service groups."""
     if not selected_groups:
         CONSOLE.print("[yellow]No service groups selected. Nothing to generate.[/yellow]")
@@ -897,152 +1935,195 @@ def generate_k8s_deploy_script(selected_groups: List[str]):
         CONSOLE.print("[yellow]No resources found for the selected groups.[/yellow]")
         return
 
-    script_name_part = "all" if len(selected_groups) == len(K8S_SERVICE_GROUPS) else "_".join(group.split()[0].lower() for group in selected_groups)
+    buckets = _categorize_manifests(manifests_to_apply)
+    secrets_and_configs = buckets["config"] + buckets["secrets"]
+    rbac_manifests = buckets["rbac"]
+    observability = buckets["observability"]
+    apps = buckets["apps"]
+
+    script_name_part = script_part or _script_name_part(selected_groups)
     script_filename_sh = f"deploy_k8s_{script_name_part}.sh"
     script_filename_ps1 = f"deploy_k8s_{script_name_part}.ps1"
+    run_hint = Panel(f"[bold cyan]./{script_filename_sh}[/bold cyan] or [bold cyan].\\{script_filename_ps1}[/bold cyan]", expand=False, padding=(0, 2))
 
-    # Bash script (includes offline guard)
-    with open(script_filename_sh, "w") as f:
-        f.write("#!/bin/bash\n")
-        f.write(f"# Deploy script for: {', '.join(selected_groups)}\n")
-        f.write("# This script was generated by the EnginEdge Control Center.\nset -e\n\n")
-        f.write("kubectl cluster-info >/dev/null 2>&1 || { echo 'Cluster offline'; exit 1; }\n\n")
-        f.write("echo 'Starting Kubernetes deployment...'\n\n")
-
-        # Define helm charts here to avoid repeating this static info
-        helm_charts = {
-            "postgres-metastore": "bitnami/postgresql", 
-            "minio": "minio/minio",
-            "kafka": "bitnami/kafka", 
-            "redis": "bitnami/redis",
-            "kube-prometheus-stack": "prometheus-community/kube-prometheus-stack"
-        }
-        helm_values = {
-            "postgres-metastore": "charts/postgres/values.yaml", 
-            "minio": "charts/minio/values.yaml",
-            "kafka": "charts/kafka/values.yaml", 
-            "redis": "charts/redis/values.yaml",
-            "kube-prometheus-stack": "observability/helm-values.yaml"
-        }
+    header = f"# enginedge-hash: {_script_inputs_hash(manifests_to_apply, selected_groups, helm_releases_to_install)}\n"
+    if _scripts_up_to_date([script_filename_sh, script_filename_ps1], header):
+        CONSOLE.print(f"\n[green]Deploy scripts are up to date: '{script_filename_sh}', '{script_filename_ps1}'[/green]")
+        CONSOLE.print(run_hint)
+        return
 
-        # Write commands in a logical order: manifests (secrets/configs), then helm, then apps
-        secrets_and_configs = [m for m in manifests_to_apply if "secrets/" in m or "config/" in m]
-        rbac_manifests = [m for m in manifests_to_apply if "rbac/" in m]
-        apps = [m for m in manifests_to_apply if "apps/" in m]
-        observability = [m for m in manifests_to_apply if "observability/" in m]
-
-        if secrets_and_configs:
-            f.write("# --- Applying Secrets and ConfigMaps ---\n")
-            for manifest in sorted(secrets_and_configs):
-                f.write(f"kubectl apply -f {manifest}\n")
-            f.write("\n")
-
-        if rbac_manifests:
-            f.write("# --- Applying RBAC Resources ---\n")
-            for manifest in sorted(rbac_manifests):
-                f.write(f"kubectl apply -f {manifest}\n")
-            f.write("\n")
-
-        if helm_releases_to_install:
-            f.write("# --- Installing Helm Charts for 3rd party services ---\n")
-            f.write("helm repo add bitnami https://charts.bitnami.com/bitnami\n")
-            f.write("helm repo add minio https://charts.min.io/\n")
-            f.write("helm repo add prometheus-community https://prometheus-community.github.io/helm-charts\n")
-            f.write("helm repo update\n\n")
-            for release in helm_releases_to_install:
-                chart = helm_charts.get(release)
-                values_rel = helm_values.get(release)
-                if chart and values_rel:
-                    values = os.path.join(K8S_DIR, values_rel)
-                    f.write(f"helm upgrade --install {release} {chart} -f {values} --namespace default\n")
-            f.write("\n")
-
-        if observability:
-            f.write("# --- Applying Observability Manifests ---\n")
-            for manifest in sorted(observability):
-                f.write(f"kubectl apply -f {manifest}\n")
-            f.write("\n")
-
-        if apps:
-            f.write("# --- Deploying Core Applications ---\n")
-            for manifest in sorted(apps):
-                f.write(f"kubectl apply -f {manifest}\n")
-            f.write("\n")
-
-        f.write("echo 'Kubernetes deployment finished.'\n")
+    helm_repo_lines = ["# --- Installing Helm Charts for 3rd party services ---\n"]
+    helm_repo_lines += [f"helm repo add {name} {url}\n" for name, url in HELM_REPOS]
+    helm_repo_lines.append("helm repo update\n\n")
+
+    # Bash script (includes offline guard); assembled in memory and written once
+    lines: List[str] = [
+        "#!/bin/bash\n",
+        header,
+        f"# Deploy script for: {', '.join(selected_groups)}\n",
+        "# This script was generated by the EnginEdge Control Center.\nset -e\n\n",
+        "kubectl cluster-info >/dev/null 2>&1 || { echo 'Cluster offline'; exit 1; }\n\n",
+        "echo 'Starting Kubernetes deployment...'\n\n",
+    ]
+
+    # Write commands in a logical order: manifests (secrets/configs), then helm, then apps
+    if secrets_and_configs:
+        lines += ["# --- Applying Secrets and ConfigMaps ---\n", _kubectl_apply_sh(secrets_and_configs), "\n"]
+
+    if rbac_manifests:
+        lines += ["# --- Applying RBAC Resources ---\n", _kubectl_apply_sh(rbac_manifests), "\n"]
+
+    if helm_releases_to_install:
+        lines += helm_repo_lines
+        installs = _helm_installs(K8S_DIR)
+        for release in helm_releases_to_install:
+            if release in installs:
+                chart, values = installs[release]
+                lines.append(f"helm upgrade --install {release} {chart} -f {values} --namespace default\n")
+        lines.append("\n")
+
+    if observability:
+        lines += ["# --- Applying Observability Manifests ---\n", _kubectl_apply_sh(observability), "\n"]
+
+    if apps:
+        lines += ["# --- Deploying Core Applications ---\n", _kubectl_apply_sh(apps), "\n"]
+
+    lines.append("echo 'Kubernetes deployment finished.'\n")
+
+    # LF line endings so the script runs under bash even when generated on Windows
+    _write_script(script_filename_sh, lines)
 
     os.chmod(script_filename_sh, 0o755)
 
     # PowerShell script (includes offline guard)
-    with open(script_filename_ps1, "w") as f:
-        f.write("Param()\n")
-        f.write("$ErrorActionPreference = 'Stop'\n")
-        f.write(f"Write-Host 'Deploying: {', '.join(selected_groups)}'\n")
-        f.write("try { kubectl cluster-info | Out-Null } catch { Write-Host 'Cluster offline'; exit 1 }\n")
-        f.write("Write-Host 'Starting Kubernetes deployment...'\n\n")
-
-        secrets_and_configs_ps = [m for m in manifests_to_apply if "secrets/" in m or "config/" in m]
-        if secrets_and_configs_ps:
-            f.write("# --- Applying Secrets and ConfigMaps ---\n")
-            for manifest in sorted(secrets_and_configs_ps):
-                f.write(f"kubectl apply -f '{manifest}'\n")
-            f.write("\n")
-
-        rbac_manifests_ps = [m for m in manifests_to_apply if "rbac/" in m]
-        if rbac_manifests_ps:
-            f.write("# --- Applying RBAC Resources ---\n")
-            for manifest in sorted(rbac_manifests_ps):
-                f.write(f"kubectl apply -f '{manifest}'\n")
-            f.write("\n")
-
-        if helm_releases_to_install:
-            f.write("# --- Installing Helm Charts for 3rd party services ---\n")
-            f.write("helm repo add bitnami https://charts.bitnami.com/bitnami\n")
-            f.write("helm repo add minio https://charts.min.io/\n")
-            f.write("helm repo add prometheus-community https://prometheus-community.github.io/helm-charts\n")
-            f.write("helm repo update\n\n")
-            helm_charts = {
-                "postgres-metastore": "bitnami/postgresql",
-                "minio": "minio/minio",
-                "kafka": "bitnami/kafka",
-                "redis": "bitnami/redis",
-                "kube-prometheus-stack": "prometheus-community/kube-prometheus-stack"
-            }
-            helm_values = {
-                "postgres-metastore": "charts/postgres/values.yaml",
-                "minio": "charts/minio/values.yaml",
-                "kafka": "charts/kafka/values.yaml",
-                "redis": "charts/redis/values.yaml",
-                "kube-prometheus-stack": "observability/helm-values.yaml"
-            }
-            for release in helm_releases_to_install:
-                chart = helm_charts.get(release)
-                values_rel = helm_values.get(release)
-                if chart and values_rel:
-                    values = os.path.join(K8S_DIR, values_rel)
-                    f.write(f"helm upgrade --install {release} {chart} -f '{values}' --namespace default\n")
-            f.write("\n")
-
-        observability_ps = [m for m in manifests_to_apply if "observability/" in m]
-        if observability_ps:
-            f.write("# --- Applying Observability Manifests ---\n")
-            for manifest in sorted(observability_ps):
-                f.write(f"kubectl apply -f '{manifest}'\n")
-            f.write("\n")
-
-        f.write("# --- Deploying Core Applications ---\n")
-        for manifest in sorted([m for m in manifests_to_apply if "apps/" in m]):
-            f.write(f"kubectl apply -f '{manifest}'\n")
-        f.write("\n")
-
-        f.write("Write-Host 'Kubernetes deployment finished.'\n")
+    lines = [
+        header,
+        "Param()\n",
+        "$ErrorActionPreference = 'Stop'\n",
+        f"Write-Host 'Deploying: {', '.join(selected_groups)}'\n",
+        "try { kubectl cluster-info | Out-Null } catch { Write-Host 'Cluster offline'; exit 1 }\n",
+        "Write-Host 'Starting Kubernetes deployment...'\n\n",
+    ]
+
+    if secrets_and_configs:
+        lines += ["# --- Applying Secrets and ConfigMaps ---\n", _kubectl_apply_ps1(secrets_and_configs), "\n"]
+
+    if rbac_manifests:
+        lines += ["# --- Applying RBAC Resources ---\n", _kubectl_apply_ps1(rbac_manifests), "\n"]
+
+    if helm_releases_to_install:
+        lines += helm_repo_lines
+        installs = _helm_installs(K8S_DIR)
+        for release in helm_releases_to_install:
+            if release in installs:
+                chart, values = installs[release]
+                lines.append(f"helm upgrade --install {release} {chart} -f '{values}' --namespace default\n")
+        lines.append("\n")
+
+    if observability:
+        lines += ["# --- Applying Observability Manifests ---\n", _kubectl_apply_ps1(observability), "\n"]
+
+    lines.append("# --- Deploying Core Applications ---\n")
+    if apps:
+        lines.append(_kubectl_apply_ps1(apps))
+    lines.append("\n")
+
+    lines.append("Write-Host 'Kubernetes deployment finished.'\n")
+
+    # Text mode used to translate to CRLF on Windows; keep PowerShell files native.
+    _write_script(script_filename_ps1, lines, crlf=IS_WINDOWS)
 
     CONSOLE.print(f"\n[bold green]Deploy scripts created: '{script_filename_sh}', '{script_filename_ps1}'[/bold green]")
-    CONSOLE.print(Panel(f"[bold cyan]./{script_filename_sh}[/bold cyan] or [bold cyan].\\{script_filename_ps1}[/bold cyan]", expand=False, padding=(0, 2)))
+    CONSOLE.print(run_hint)
+
+
+def _kubectl_per_deployment(args: List[str], deployments: List[str]) -> Dict[str, Optional[str]]:
+    """Run one kubectl command over all deployment/<name> args.
+
+    Returns name -> None on success, or the matching error line from stderr.
+    """
+    if not deployments:
+        return {}
+    result = subprocess.run(
+        [_KUBECTL, *args, *(f"deployment/{d}" for d in deployments), "-n", "default"],
+        capture_output=True,
+        text=True,
+        errors="replace",
+    )
+    out = result.stdout or ""
+    err_lines = (result.stderr or "").splitlines()
+    if result.returncode != 0:
+        _invalidate_cluster_online_cache()
+    status: Dict[str, Optional[str]] = {}
+    for d in deployments:
+        if f"deployment.apps/{d} " in out:
+            status[d] = None
+        else:
+            status[d] = next((line for line in err_lines if f'"{d}"' in line), "\n".join(err_lines) or "no output from kubectl")
+    return status
+
+
+def _patch_deployments(deployments: List[str], patch: Dict, subresource: str = "") -> Dict[str, Optional[str]]:
+    """Strategic-merge PATCH each deployment (or its subresource) over the API.
+
+    Uses the Python client or the shared `kubectl proxy`, so no kubectl process
+    is spawned. Returns the same map as _kubectl_per_deployment, but only for the
+    deployments reached before a transport failure; the caller falls back to
+    kubectl for the ones missing from it.
+    """
+    if not deployments:
+        return {}
+
+    def error_for(name: str, code: int, body) -> str:
+        if code == 404:
+            return f'deployments.apps "{name}" not found'
+        try:
+            return _json_loads(body or b"{}").get("message") or f"HTTP {code}"
+        except ValueError:
+            return f"HTTP {code}"
+
+    status: Dict[str, Optional[str]] = {}
+    api = _k8s_api_client()
+    if api is not None:
+        from kubernetes import client
+        apps = client.AppsV1Api(api)
+        patch_fn = apps.patch_namespaced_deployment_scale if subresource == "scale" else apps.patch_namespaced_deployment
+        try:
+            for d in deployments:
+                try:
+                    patch_fn(d, "default", patch, _preload_content=False, _request_timeout=_K8S_REQUEST_TIMEOUT)
+                    status[d] = None
+                except client.ApiException as e:
+                    status[d] = error_for(d, e.status, e.body)
+        except Exception:
+            pass
+    else:
+        body = json.dumps(patch).encode()
+        suffix = f"/{subresource}" if subresource else ""
+        try:
+            for d in deployments:
+                result = _kubectl_proxy_request(
+                    "PATCH",
+                    f"/apis/apps/v1/namespaces/default/deployments/{d}{suffix}",
+                    body,
+                    "application/strategic-merge-patch+json",
+                )
+                if result is None:
+                    break
+                code, resp_body = result
+                status[d] = None if code in (200, 201) else error_for(d, code, resp_body)
+        except Exception:
+            pass
+    if any(error is not None for error in status.values()):
+        _invalidate_cluster_online_cache()
+    return status
+
 
+def refresh_k8s_deployments(selected_groups: List[str], wait: bool = False):
+    """Restarts deployments by triggering a rollout restart (keeps all data/PVCs).
 
-def refresh_k8s_deployments(selected_groups: List[str]):
-    """Restarts deployments by triggering a rollout restart (keeps all data/PVCs)."""
+    With wait=True, blocks until the restarted deployments have finished rolling out.
+    """
     if not selected_groups:
         CONSOLE.print("[yellow]No service groups selected.[/yellow]")
         return
@@ -1050,29 +2131,28 @@ def refresh_k8s_deployments(selected_groups: List[str]):
     CONSOLE.print(f"\n[bold]Refreshing deployments for: {', '.join(selected_groups)}...[/bold]")
     
     try:
-        # Map groups to deployments
-        deployments_to_refresh = []
-        apps_and_configs = []
-        _, helm_releases = get_group_resources(selected_groups)
-        
-        # Get all deployment names from manifests
-        for group in selected_groups:
-            if "Stateful Backend" in group:
-                deployments_to_refresh.extend(["hexagon"])
-            if "Core Applications" in group:
-                deployments_to_refresh.extend(["agent-tool-worker", "data-processing-worker", "interview-worker", 
-                                               "latex-worker", "assistant-worker", "resume-worker", "wolfram-kernel", "hexagon"])
-            if "Scheduling App" in group:
-                deployments_to_refresh.append("scheduling-model")
-        
-        # Restart each deployment
-        for deployment in deployments_to_refresh:
-            try:
-                cmd = ["kubectl", "rollout", "restart", f"deployment/{deployment}", "-n", "default"]
-                subprocess.run(cmd, check=True, capture_output=True)
+        deployments_to_refresh = _group_deployments(selected_groups)
+
+        # Same restartedAt annotation bump as `kubectl rollout restart`
+        restarted_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        patch = {"spec": {"template": {"metadata": {"annotations": {"kubectl.kubernetes.io/restartedAt": restarted_at}}}}}
+        status = _patch_deployments(deployments_to_refresh, patch)
+        remaining = [d for d in deployments_to_refresh if d not in status]
+        if remaining:
+            status.update(_kubectl_per_deployment(["rollout", "restart"], remaining))
+        for deployment, error in status.items():
+            if error is None:
                 CONSOLE.print(f"[green]✓[/green] Restarted deployment: {deployment}")
-            except subprocess.CalledProcessError as e:
-                CONSOLE.print(f"[yellow]⚠[/yellow] Could not restart {deployment}: {e.stderr.decode()}")
+            else:
+                CONSOLE.print(f"[yellow]⚠[/yellow] Could not restart {deployment}: {error}")
+
+        restarted = [d for d, error in status.items() if error is None]
+        if wait and restarted:
+            CONSOLE.print(f"[cyan]Waiting for {len(restarted)} deployment(s) to finish rolling out...[/cyan]")
+            if _wait_deployments_rolled_out(restarted):
+                CONSOLE.print("[green]All restarted deployments have rolled out.[/green]")
+            else:
+                CONSOLE.print("[yellow]Some deployments did not finish rolling out in time.[/yellow]")
         
         CONSOLE.print("[bold green]Deployment refresh finished.[/bold green]")
         CONSOLE.print("[cyan]Data and PersistentVolumes preserved. Pods will restart with the same configuration.[/cyan]")
@@ -1090,26 +2170,17 @@ def stop_k8s_deployments(selected_groups: List[str]):
     CONSOLE.print(f"\n[bold]Scaling down deployments for: {', '.join(selected_groups)}...[/bold]")
     
     try:
-        deployments_to_stop = []
-        
-        # Map groups to deployments
-        for group in selected_groups:
-            if "Stateful Backend" in group:
-                deployments_to_stop.extend(["hexagon"])
-            if "Core Applications" in group:
-                deployments_to_stop.extend(["agent-tool-worker", "data-processing-worker", "interview-worker", 
-                                            "latex-worker", "assistant-worker", "resume-worker", "wolfram-kernel"])
-            if "Scheduling App" in group:
-                deployments_to_stop.append("scheduling-model")
-        
-        # Scale down each deployment
-        for deployment in deployments_to_stop:
-            try:
-                cmd = ["kubectl", "scale", f"deployment/{deployment}", "--replicas=0", "-n", "default"]
-                subprocess.run(cmd, check=True, capture_output=True)
+        deployments_to_stop = _group_deployments(selected_groups)
+
+        status = _patch_deployments(deployments_to_stop, {"spec": {"replicas": 0}}, "scale")
+        remaining = [d for d in deployments_to_stop if d not in status]
+        if remaining:
+            status.update(_kubectl_per_deployment(["scale", "--replicas=0"], remaining))
+        for deployment, error in status.items():
+            if error is None:
                 CONSOLE.print(f"[green]✓[/green] Scaled down deployment: {deployment}")
-            except subprocess.CalledProcessError as e:
-                CONSOLE.print(f"[yellow]⚠[/yellow] Could not scale down {deployment}: {e.stderr.decode()}")
+            else:
+                CONSOLE.print(f"[yellow]⚠[/yellow] Could not scale down {deployment}: {error}")
         
         CONSOLE.print("[bold green]Deployment scaling finished.[/bold green]")
         CONSOLE.print("[cyan]Pods stopped but data and PersistentVolumes preserved. Use 'Refresh' to restart.[/cyan]")
@@ -1118,7 +2189,7 @@ def stop_k8s_deployments(selected_groups: List[str]):
         CONSOLE.print(f"[red]Error during stop: {e}[/red]")
 
 
-def generate_k8s_destroy_script(selected_groups: List[str], preserve_pvc: bool = False):
+def generate_k8s_destroy_script(selected_groups: List[str], preserve_pvc: bool = False, script_part: Optional[str] = None):
     """Generates destroy scripts (.sh and .ps1) for the selected groups."""
     if not selected_groups:
         CONSOLE.print("[yellow]No service groups selected. Nothing to generate.[/yellow]")
@@ -1132,9 +2203,17 @@ def generate_k8s_destroy_script(selected_groups: List[str], preserve_pvc: bool =
         CONSOLE.print("[yellow]No resources found for the selected groups.[/yellow]")
         return
 
-    script_name_part = "all" if len(selected_groups) == len(K8S_SERVICE_GROUPS) else "_".join(group.split()[0].lower() for group in selected_groups)
+    script_name_part = script_part or _script_name_part(selected_groups)
     script_filename_sh = f"destroy_k8s_{script_name_part}.sh"
     script_filename_ps1 = f"destroy_k8s_{script_name_part}.ps1"
+    run_hint = Panel(f"[bold cyan]./{script_filename_sh}[/bold cyan] or [bold cyan].\\{script_filename_ps1}[/bold cyan]", expand=False, padding=(0, 2))
+
+    # Skip regeneration (and the manifest parsing below) when nothing changed.
+    header = f"# enginedge-hash: {_script_inputs_hash(manifests_to_delete, selected_groups, helm_releases_to_delete, preserve_pvc)}\n"
+    if _scripts_up_to_date([script_filename_sh, script_filename_ps1], header):
+        CONSOLE.print(f"\n[orange_red1]Destroy scripts are up to date: '{script_filename_sh}', '{script_filename_ps1}'[/orange_red1]")
+        CONSOLE.print(run_hint)
+        return
 
     def extract_pvc_names_from_manifests(manifest_paths: List[str]) -> List[str]:
         """Extract PVC names from manifest files so we can exclude them when preserve_pvc is True."""
@@ -1143,13 +2222,14 @@ def generate_k8s_destroy_script(selected_groups: List[str], preserve_pvc: bool =
             if not os.path.exists(path):
                 continue
             try:
-                with open(path, "r") as f:
-                    for doc in yaml.safe_load_all(f):
-                        if isinstance(doc, dict) and doc.get("kind") == "PersistentVolumeClaim":
-                            metadata = doc.get("metadata", {})
-                            name = metadata.get("name")
-                            if name:
-                                pvc_names.append(name)
+                with open(path, "rb") as f:
+                    data = f.read()
+                for doc in _yaml_load_all()(data):
+                    if isinstance(doc, dict) and doc.get("kind") == "PersistentVolumeClaim":
+                        metadata = doc.get("metadata", {})
+                        name = metadata.get("name")
+                        if name:
+                            pvc_names.append(name)
             except Exception:
                 continue
         return pvc_names
@@ -1163,15 +2243,16 @@ def generate_k8s_destroy_script(selected_groups: List[str], preserve_pvc: bool =
         if not os.path.exists(manifest_path):
             return resources
         try:
-            with open(manifest_path, "r") as f:
-                for doc in yaml.safe_load_all(f):
-                    if isinstance(doc, dict) and doc.get("kind") and doc.get("metadata"):
-                        kind = doc.get("kind")
-                        metadata = doc.get("metadata", {})
-                        name = metadata.get("name")
-                        namespace = metadata.get("namespace", "default")
-                        if name:
-                            resources.append((kind, name, namespace))
+            with open(manifest_path, "rb") as f:
+                data = f.read()
+            for doc in _yaml_load_all()(data):
+                if isinstance(doc, dict) and doc.get("kind") and doc.get("metadata"):
+                    kind = doc.get("kind")
+                    metadata = doc.get("metadata", {})
+                    name = metadata.get("name")
+                    namespace = metadata.get("namespace", "default")
+                    if name:
+                        resources.append((kind, name, namespace))
         except Exception:
             pass
         return resources
@@ -1195,140 +2276,150 @@ def generate_k8s_destroy_script(selected_groups: List[str], preserve_pvc: bool =
         # Use mapping if available, otherwise lowercase the kind
         return kind_map.get(kind, kind.lower())
 
+    buckets = _categorize_manifests(manifests_to_delete)
+    secrets = buckets["secrets"][::-1]
+    combined_manifests = sorted(buckets["apps"] + buckets["config"] + buckets["rbac"], reverse=True)
+
+    # When preserving PVCs, delete the manifests' resources by name (batched per
+    # namespace) so the PVCs can be left out; unparseable files fall back to -f.
+    resources_by_namespace: Dict[str, List[str]] = {}
+    skipped_pvcs: List[str] = []
+    unparsed_manifests: List[str] = []
+    if preserve_pvc and pvc_names_to_preserve:
+        preserved = frozenset(pvc_names_to_preserve)
+        for file in combined_manifests:
+            resources = extract_resources_from_manifest(file)
+            if not resources:
+                unparsed_manifests.append(file)
+                continue
+            for kind, name, namespace in resources:
+                if kind == "PersistentVolumeClaim" and name in preserved:
+                    skipped_pvcs.append(name)
+                else:
+                    resources_by_namespace.setdefault(namespace, []).append(f"{kind_to_resource_type(kind)}/{name}")
+
     # Bash script (includes offline guard)
-    with open(script_filename_sh, "w") as f:
-        f.write("#!/bin/bash\n# Destroys selected application components from Kubernetes.\nset -e\n\n")
-        f.write("kubectl cluster-info >/dev/null 2>&1 || { echo 'Cluster offline'; exit 1; }\n\n")
-        f.write(f"echo 'Starting Kubernetes teardown for: {', '.join(selected_groups)}...'\n\n")
-
-        apps_and_configs = [m for m in manifests_to_delete if "apps/" in m or "config/" in m]
-        rbac_manifests = [m for m in manifests_to_delete if "rbac/" in m]
-        secrets = [m for m in manifests_to_delete if "secrets/" in m]
-
-        if apps_and_configs or rbac_manifests:
-            f.write("# --- Deleting Applications, ConfigMaps, and RBAC ---\n")
-            combined_manifests = sorted(apps_and_configs + rbac_manifests, reverse=True)
-            if preserve_pvc and pvc_names_to_preserve:
-                # When preserving PVCs, delete resources individually, excluding PVCs
-                f.write("# Note: PVCs are being preserved, deleting resources individually...\n")
-                for file in combined_manifests:
-                    resources = extract_resources_from_manifest(file)
-                    if resources:
-                        f.write(f"# Processing {file} (excluding PVCs)\n")
-                        for kind, name, namespace in resources:
-                            if kind == "PersistentVolumeClaim" and name in pvc_names_to_preserve:
-                                f.write(f"# Skipping PVC '{name}' (preserve_pvc=true)\n")
-                            else:
-                                resource_type = kind_to_resource_type(kind)
-                                f.write(f"kubectl delete {resource_type}/{name} -n {namespace} --ignore-not-found=true\n")
-                    else:
-                        # Fallback to file-based deletion if parsing fails
-                        f.write(f"kubectl delete -f {file} --ignore-not-found=true\n")
-            else:
-                # Normal deletion when not preserving PVCs
-                for file in combined_manifests:
-                    f.write(f"kubectl delete -f {file} --ignore-not-found=true\n")
-            f.write("\n")
-
-        if helm_releases_to_delete:
-            f.write("# --- Deleting Helm Releases ---\n")
-            for release in helm_releases_to_delete:
-                # Try uninstall; if not installed, ignore error
-                f.write(f"helm status {release} --namespace default >/dev/null 2>&1 && helm delete {release} --namespace default || true\n")
-            f.write("\n")
-
-        if secrets:
-            f.write("# --- Deleting Secrets ---\n")
-            for file in sorted(secrets, reverse=True):
-                f.write(f"[ -f {file} ] && kubectl delete -f {file} --ignore-not-found=true || true\n")
-            f.write("\n")
-
-        if preserve_pvc:
-            f.write("# --- Preserving PersistentVolumeClaims ---\n")
-            if pvc_names_to_preserve:
-                f.write("echo 'Preserving PersistentVolumeClaims: " + ", ".join(pvc_names_to_preserve) + "'\n")
-                for pvc_name in pvc_names_to_preserve:
-                    f.write(f"# PVC '{pvc_name}' is preserved and will not be deleted\n")
-            f.write("echo 'PersistentVolumeClaims preserved (wolfram-state and other PVCs retained).'\n")
-        else:
-            f.write("# --- Deleting PersistentVolumeClaims ---\n")
-            f.write("kubectl delete pvc --all -n default --ignore-not-found=true\n")
-            f.write("\n")
+    lines: List[str] = [
+        "#!/bin/bash\n",
+        header,
+        "# Destroys selected application components from Kubernetes.\nset -e\n\n",
+        "kubectl cluster-info >/dev/null 2>&1 || { echo 'Cluster offline'; exit 1; }\n\n",
+        f"echo 'Starting Kubernetes teardown for: {', '.join(selected_groups)}...'\n\n",
+    ]
 
-        f.write("echo 'Kubernetes teardown finished.'\n")
+    if combined_manifests:
+        lines.append("# --- Deleting Applications, ConfigMaps, and RBAC ---\n")
+        if preserve_pvc and pvc_names_to_preserve:
+            lines.append("# Note: PVCs are being preserved, deleting resources by name...\n")
+            for name in skipped_pvcs:
+                lines.append(f"# Skipping PVC '{name}' (preserve_pvc=true)\n")
+            for namespace, targets in resources_by_namespace.items():
+                lines.append(_kubectl_delete_sh(targets, namespace))
+            if unparsed_manifests:
+                lines.append(_kubectl_delete_sh([f"-f {m}" for m in unparsed_manifests]))
+        else:
+            lines.append(_kubectl_delete_sh([f"-f {m}" for m in combined_manifests]))
+        lines.append("\n")
+
+    if helm_releases_to_delete:
+        lines.append("# --- Deleting Helm Releases ---\n")
+        for release in helm_releases_to_delete:
+            # Try uninstall; if not installed, ignore error
+            lines.append(f"helm status {release} --namespace default >/dev/null 2>&1 && helm delete {release} --namespace default || true\n")
+        lines.append("\n")
+
+    if secrets:
+        lines.append("# --- Deleting Secrets ---\n")
+        lines.append("secret_args=()\n")
+        lines.append("for file in " + " ".join(secrets) + "; do\n")
+        lines.append('  if [ -f "$file" ]; then secret_args+=(-f "$file"); fi\n')
+        lines.append("done\n")
+        lines.append('if [ ${#secret_args[@]} -gt 0 ]; then kubectl delete "${secret_args[@]}" --ignore-not-found=true || true; fi\n')
+        lines.append("\n")
+
+    if preserve_pvc:
+        lines.append("# --- Preserving PersistentVolumeClaims ---\n")
+        if pvc_names_to_preserve:
+            lines.append("echo 'Preserving PersistentVolumeClaims: " + ", ".join(pvc_names_to_preserve) + "'\n")
+            for pvc_name in pvc_names_to_preserve:
+                lines.append(f"# PVC '{pvc_name}' is preserved and will not be deleted\n")
+        lines.append("echo 'PersistentVolumeClaims preserved (wolfram-state and other PVCs retained).'\n")
+    else:
+        lines.append("# --- Deleting PersistentVolumeClaims ---\n")
+        lines.append("kubectl delete pvc --all -n default --ignore-not-found=true\n")
+        lines.append("\n")
+
+    lines.append("echo 'Kubernetes teardown finished.'\n")
+
+    _write_script(script_filename_sh, lines)
 
     os.chmod(script_filename_sh, 0o755)
 
     # PowerShell script (includes offline guard)
-    with open(script_filename_ps1, "w") as f:
-        f.write("Param()\n")
-        f.write("$ErrorActionPreference = 'Stop'\n")
-        f.write(f"Write-Host 'Tearing down: {', '.join(selected_groups)}'\n")
-        f.write("try { kubectl cluster-info | Out-Null } catch { Write-Host 'Cluster offline'; exit 1 }\n")
-        f.write("Write-Host 'Starting Kubernetes teardown...'\n\n")
-
-        apps_and_configs_ps = [m for m in manifests_to_delete if "apps/" in m or "config/" in m]
-        rbac_manifests_ps = [m for m in manifests_to_delete if "rbac/" in m]
-        if apps_and_configs_ps or rbac_manifests_ps:
-            f.write("# --- Deleting Applications, ConfigMaps, and RBAC ---\n")
-            combined_manifests_ps = sorted(apps_and_configs_ps + rbac_manifests_ps, reverse=True)
-            if preserve_pvc and pvc_names_to_preserve:
-                # When preserving PVCs, delete resources individually, excluding PVCs
-                f.write("# Note: PVCs are being preserved, deleting resources individually...\n")
-                for file in combined_manifests_ps:
-                    resources = extract_resources_from_manifest(file)
-                    if resources:
-                        f.write(f"# Processing {file} (excluding PVCs)\n")
-                        for kind, name, namespace in resources:
-                            if kind == "PersistentVolumeClaim" and name in pvc_names_to_preserve:
-                                f.write(f"# Skipping PVC '{name}' (preserve_pvc=true)\n")
-                            else:
-                                resource_type = kind_to_resource_type(kind)
-                                f.write(f"kubectl delete {resource_type}/{name} -n {namespace} --ignore-not-found=true\n")
-                    else:
-                        # Fallback to file-based deletion if parsing fails
-                        f.write(f"kubectl delete -f '{file}' --ignore-not-found=true\n")
-            else:
-                # Normal deletion when not preserving PVCs
-                for file in combined_manifests_ps:
-                    f.write(f"kubectl delete -f '{file}' --ignore-not-found=true\n")
-            f.write("\n")
-
-        if helm_releases_to_delete:
-            f.write("# --- Deleting Helm Releases ---\n")
-            for release in helm_releases_to_delete:
-                # Only delete if installed to avoid noisy errors
-                f.write(f"if (helm status {release} --namespace default 2>$null) {{ helm delete {release} --namespace default }}\n")
-            f.write("\n")
-
-        if [m for m in manifests_to_delete if "secrets/" in m]:
-            f.write("# --- Deleting Secrets ---\n")
-            for file in sorted([m for m in manifests_to_delete if "secrets/" in m], reverse=True):
-                f.write(f"if (Test-Path '{file}') {{ kubectl delete -f '{file}' --ignore-not-found=true }}\n")
-            f.write("\n")
-
-        if preserve_pvc:
-            f.write("# --- Preserving PersistentVolumeClaims ---\n")
-            if pvc_names_to_preserve:
-                f.write("Write-Host 'Preserving PersistentVolumeClaims: " + ", ".join(pvc_names_to_preserve) + "'\n")
-                for pvc_name in pvc_names_to_preserve:
-                    f.write(f"# PVC '{pvc_name}' is preserved and will not be deleted\n")
-            f.write("Write-Host 'PersistentVolumeClaims preserved (wolfram-state and other PVCs retained).'\n")
-        else:
-            f.write("# --- Deleting PersistentVolumeClaims ---\n")
-            f.write("kubectl delete pvc --all -n default --ignore-not-found=true\n")
-            f.write("\n")
+    lines = [
+        header,
+        "Param()\n",
+        "$ErrorActionPreference = 'Stop'\n",
+        f"Write-Host 'Tearing down: {', '.join(selected_groups)}'\n",
+        "try { kubectl cluster-info | Out-Null } catch { Write-Host 'Cluster offline'; exit 1 }\n",
+        "Write-Host 'Starting Kubernetes teardown...'\n\n",
+    ]
 
-        f.write("Write-Host 'Kubernetes teardown finished.'\n")
+    if combined_manifests:
+        lines.append("# --- Deleting Applications, ConfigMaps, and RBAC ---\n")
+        if preserve_pvc and pvc_names_to_preserve:
+            lines.append("# Note: PVCs are being preserved, deleting resources by name...\n")
+            for name in skipped_pvcs:
+                lines.append(f"# Skipping PVC '{name}' (preserve_pvc=true)\n")
+            for namespace, targets in resources_by_namespace.items():
+                lines.append(_kubectl_delete_ps1(targets, namespace))
+            if unparsed_manifests:
+                lines.append(_kubectl_delete_ps1([f"-f '{m}'" for m in unparsed_manifests]))
+        else:
+            lines.append(_kubectl_delete_ps1([f"-f '{m}'" for m in combined_manifests]))
+        lines.append("\n")
+
+    if helm_releases_to_delete:
+        lines.append("# --- Deleting Helm Releases ---\n")
+        for release in helm_releases_to_delete:
+            # Only delete if installed to avoid noisy errors
+            lines.append(f"if (helm status {release} --namespace default 2>$null) {{ helm delete {release} --namespace default }}\n")
+        lines.append("\n")
+
+    if secrets:
+        lines.append("# --- Deleting Secrets ---\n")
+        lines.append("$secretFiles = @(" + ", ".join(f"'{m}'" for m in secrets) + ") | Where-Object { Test-Path $_ }\n")
+        lines.append("if ($secretFiles) { kubectl delete @($secretFiles | ForEach-Object { '-f'; $_ }) --ignore-not-found=true }\n")
+        lines.append("\n")
+
+    if preserve_pvc:
+        lines.append("# --- Preserving PersistentVolumeClaims ---\n")
+        if pvc_names_to_preserve:
+            lines.append("Write-Host 'Preserving PersistentVolumeClaims: " + ", ".join(pvc_names_to_preserve) + "'\n")
+            for pvc_name in pvc_names_to_preserve:
+                lines.append(f"# PVC '{pvc_name}' is preserved and will not be deleted\n")
+        lines.append("Write-Host 'PersistentVolumeClaims preserved (wolfram-state and other PVCs retained).'\n")
+    else:
+        lines.append("# --- Deleting PersistentVolumeClaims ---\n")
+        lines.append("kubectl delete pvc --all -n default --ignore-not-found=true\n")
+        lines.append("\n")
+
+    lines.append("Write-Host 'Kubernetes teardown finished.'\n")
+
+    # Text mode used to translate to CRLF on Windows; keep PowerShell files native.
+    _write_script(script_filename_ps1, lines, crlf=IS_WINDOWS)
 
     CONSOLE.print(f"\n[bold orange_red1]Destroy scripts created: '{script_filename_sh}', '{script_filename_ps1}'[/bold orange_red1]")
-    CONSOLE.print(Panel(f"[bold cyan]./{script_filename_sh}[/bold cyan] or [bold cyan].\\{script_filename_ps1}[/bold cyan]", expand=False, padding=(0, 2)))
+    CONSOLE.print(run_hint)
 
 
 # --- Hybrid Dev (Docker Compose) ---
 
 def manage_dev_hybrid_environment():
     """Run selected services in Docker Compose while allowing local apps to run outside containers."""
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
     CONSOLE.print(Panel("[bold]Hybrid Dev Environment (Docker Compose)[/bold]", expand=False))
     if not _compose_available():
         CONSOLE.print(Panel(
@@ -1349,20 +2440,22 @@ def manage_dev_hybrid_environment():
         # CronJobs typically aren't in compose; skip News Ingestion Job or add here if containerized
     }
 
+    action_choices = [
+        Choice("up_all", "Up: Infra + All App Containers"),
+        Choice("up_infra", "Up: Infra only (run apps locally)"),
+        Choice("up_all_except_hexagon", "Up: All except hexagon"),
+        Choice("up_select", "Up: Choose services"),
+        Choice("wolfram_activate", "Wolfram: open activation shell"),
+        Choice("down", "Down: stop all"),
+        Choice("ps", "Status (ps)"),
+        Choice("logs", "Tail logs (interactive)"),
+        Choice(None, "Back"),
+    ]
+
     while True:
         action = inquirer.select(
             message="Select action:",
-            choices=[
-                Choice("up_all", "Up: Infra + All App Containers"),
-                Choice("up_infra", "Up: Infra only (run apps locally)"),
-                Choice("up_all_except_hexagon", "Up: All except hexagon"),
-                Choice("up_select", "Up: Choose services"),
-                Choice("wolfram_activate", "Wolfram: open activation shell"),
-                Choice("down", "Down: stop all"),
-                Choice("ps", "Status (ps)"),
-                Choice("logs", "Tail logs (interactive)"),
-                Choice(None, "Back"),
-            ],
+            choices=action_choices,
             default="up_infra",
         ).execute()
 
@@ -1407,7 +2500,7 @@ def manage_dev_hybrid_environment():
                 # Open shell
                 try:
                     # Prefer docker compose v2
-                    if shutil.which("docker"):
+                    if _docker_available():
                         subprocess.run(["docker", "exec", "-it", "wolfram-kernel", "/bin/bash"])
                     else:
                         subprocess.run(["docker-compose", "exec", "wolfram-kernel", "/bin/bash"])  # fallback
@@ -1415,25 +2508,19 @@ def manage_dev_hybrid_environment():
                     pass
             elif action == "up_select":
                 # Offer selection by groups first, then optionally individual services
-                group_choices = [Choice(value=name, name=f"{name}: {K8S_SERVICE_GROUPS[name]['description']}") for name in K8S_SERVICE_GROUPS.keys()]
                 selected_groups = inquirer.checkbox(
                     message="Select service groups (optional):",
-                    choices=group_choices,
+                    choices=list(_group_choices()),
                     cycle=True,
                 ).execute()
                 preselected: List[str] = []
                 for g in selected_groups:
                     preselected.extend(compose_groups.get(g, []))
 
-                svc_list = [
-                    "mongodb", "minio", "postgres", "redis", "kafka", "kafka-ui",
-                    "scheduling-model", "wolfram-kernel", "hexagon",
-                ]
-                # Deduplicate and keep known ordering
-                preselected = [s for s in svc_list if s in set(preselected)]
+                wanted = set(preselected)
                 selected = inquirer.checkbox(
                     message="Select services to start:",
-                    choices=[Choice(value=s, name=s, enabled=(s in preselected)) for s in svc_list],
+                    choices=[Choice(value=s, name=s, enabled=(s in wanted)) for s in _COMPOSE_SVC_LIST],
                     cycle=True,
                 ).execute()
                 if selected:
@@ -1449,22 +2536,19 @@ def manage_dev_hybrid_environment():
                 subprocess.run(cmd, check=True)
             elif action == "logs":
                 # Interactive: let user pick a service to tail
-                svc_list = [
-                    "mongodb", "minio", "postgres", "redis", "kafka", "kafka-ui",
-                    "scheduling-model", "wolfram-kernel", "hexagon",
-                ]
-                service = inquirer.select(message="Select service:", choices=svc_list).execute()
+                service = inquirer.select(message="Select service:", choices=list(_COMPOSE_SVC_LIST)).execute()
                 if service:
                     cmd = _compose_cmd(["logs", "-f", service])
-                    try:
-                        subprocess.run(cmd, check=True)
-                    except KeyboardInterrupt:
-                        pass
+                    code = _follow_logs(cmd, f"logs: {service}")
+                    if code:
+                        raise subprocess.CalledProcessError(code, cmd)
         except subprocess.CalledProcessError as e:
             CONSOLE.print(f"[red]Command failed: {e}[/red]")
 
 
-def _show_local_dev_hints():
+@functools.lru_cache(maxsize=1)
+def _local_dev_hints_panel() -> Panel:
+    """The hints are static, so the Text/Panel is built once and reprinted."""
     text = Text()
     text.append("Run local services in separate terminals:\n", style="bold")
     text.append("- Frontend: cd frontend && npm run dev (port 9090)\n")
@@ -1484,55 +2568,63 @@ def _show_local_dev_hints():
     text.append("- Use menu: 'Wolfram: open activation shell' to enter the container\n")
     text.append("- Run 'wolframscript' and sign in with your Wolfram ID (free developer license)\n")
     text.append("- Activation state persists across restarts\n")
-    CONSOLE.print(Panel(text, title="Local Dev Hints", border_style="cyan"))
+    return Panel(text, title="Local Dev Hints", border_style="cyan")
+
+
+def _show_local_dev_hints():
+    CONSOLE.print(_local_dev_hints_panel())
+
+
+_IMAGE_PULL_REASONS = frozenset(("ErrImageNeverPull", "ImagePullBackOff", "ErrImagePull"))
+
 
-def check_k8s_status():
-    """Checks the status of the Kubernetes cluster and deployed resources."""
+def _has_image_pull_errors(pods: List[Dict]) -> bool:
+    """True if any container in the already-fetched pod list is stuck pulling its image."""
+    return any(
+        ((cs.get("state") or {}).get("waiting") or {}).get("reason") in _IMAGE_PULL_REASONS
+        for pod in pods
+        for cs in (pod.get("status") or {}).get("containerStatuses") or []
+    )
+
+
+def _pod_status_row(pod: Dict) -> Tuple[str, str]:
+    """(status, details) for a pod, roughly as `kubectl get pods` shows them."""
+    status = pod.get("status", {}) or {}
+    container_statuses = status.get("containerStatuses", []) or []
+    phase = status.get("phase", "Unknown")
+    for cs in container_statuses:
+        state = cs.get("state", {}) or {}
+        reason = (state.get("waiting") or {}).get("reason") or (state.get("terminated") or {}).get("reason")
+        if reason:
+            phase = reason
+            break
+    ready = sum(1 for cs in container_statuses if cs.get("ready"))
+    restarts = sum(cs.get("restartCount", 0) or 0 for cs in container_statuses)
+    return phase, f"ready {ready}/{len(container_statuses)}, restarts {restarts}"
+
+
+def check_k8s_status() -> Optional[List[Dict]]:
+    """Checks the status of the Kubernetes cluster and deployed resources.
+
+    Returns the pods that were listed (for follow-up checks), or None on error.
+    """
     CONSOLE.print("\n[bold]Checking Kubernetes Cluster Status...[/bold]")
     
-    if not shutil.which("kubectl"):
-        CONSOLE.print(Panel(
-            "[red]kubectl command not found[/red]\n\n"
-            "Please ensure kubectl is installed and available in your PATH.\n"
-            "Visit: https://kubernetes.io/docs/tasks/tools/",
-            title="Missing kubectl",
-            border_style="red"
-        ))
-        return
+    if not _kubectl_available() and _k8s_api_client() is None:
+        _print_missing_kubectl()
+        return None
     
-    # First check if cluster is reachable
+    # One listing call; its failure is what tells us the cluster is unreachable.
     try:
-        # Simple connectivity test
-        connectivity_result = subprocess.run(
-            "kubectl cluster-info --request-timeout=10s", 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            check=True
-        )
-        
-        # If we get here, cluster is reachable, now get detailed status
-        cmd = "kubectl get pods,svc,pvc,cronjob --namespace default -o wide"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
-        
-        if result.stdout.strip():
-            CONSOLE.print(Panel(
-                result.stdout, 
-                title="Kubernetes Resource Status", 
-                border_style="green"
-            ))
+        grouped = _kube_list(("Pod", "Service", "PersistentVolumeClaim", "CronJob"))
+    except Exception as e:
+        _invalidate_cluster_online_cache()
+        if isinstance(e, subprocess.CalledProcessError):
+            # _kubectl_json captures bytes
+            output = ((e.stdout or b"") + (e.stderr or b"")).decode(errors="replace")
         else:
-            CONSOLE.print(Panel(
-                "No resources found in the default namespace.\n"
-                "The cluster is running but no applications are deployed.",
-                title="Cluster Status - No Resources",
-                border_style="yellow"
-            ))
-            
-    except subprocess.CalledProcessError as e:
-        output = (e.stdout or "") + (e.stderr or "")
+            output = str(e)
         normalized = output.lower()
-
         # Concise offline message for common connection-refused cases
         connection_refused = (
             "actively refused" in normalized
@@ -1543,7 +2635,7 @@ def check_k8s_status():
 
         if connection_refused:
             CONSOLE.print(Panel("Cluster offline", title="Kubernetes", border_style="yellow"))
-        elif "context" in output.lower() and "not found" in output.lower():
+        elif "context" in normalized and "not found" in normalized:
             CONSOLE.print(Panel(
                 "[red]No Kubernetes context configured[/red]\n\n"
                 "Please configure your kubectl context:\n"
@@ -1563,28 +2655,79 @@ def check_k8s_status():
                 title="Cluster Status Error",
                 border_style="red"
             ))
+        return None
+    _record_cluster_online(True)
+
+    table = Table(show_header=True, header_style="bold", box=None, pad_edge=False)
+    table.add_column("KIND", style="cyan", no_wrap=True)
+    table.add_column("NAME", no_wrap=True)
+    table.add_column("STATUS")
+    table.add_column("DETAILS")
+    for pod in grouped["Pod"]:
+        phase, details = _pod_status_row(pod)
+        style = "green" if phase in ("Running", "Succeeded", "Completed") else "yellow"
+        table.add_row("pod", pod.get("metadata", {}).get("name", ""), f"[{style}]{phase}[/{style}]", details)
+    for svc in grouped["Service"]:
+        spec = svc.get("spec", {}) or {}
+        ports = ",".join(f"{p.get('port')}/{p.get('protocol', 'TCP')}" for p in spec.get("ports", []) or [])
+        table.add_row("svc", svc.get("metadata", {}).get("name", ""), spec.get("type", ""), f"{spec.get('clusterIP', '')} {ports}".strip())
+    for pvc in grouped["PersistentVolumeClaim"]:
+        status = pvc.get("status", {}) or {}
+        capacity = (status.get("capacity") or {}).get("storage", "")
+        table.add_row("pvc", pvc.get("metadata", {}).get("name", ""), status.get("phase", ""), capacity)
+    for cj in grouped["CronJob"]:
+        spec = cj.get("spec", {}) or {}
+        last = (cj.get("status") or {}).get("lastScheduleTime") or "never"
+        state = "Suspended" if spec.get("suspend") else "Active"
+        table.add_row("cronjob", cj.get("metadata", {}).get("name", ""), state, f"{spec.get('schedule', '')} (last: {last})")
+
+    if table.row_count:
+        CONSOLE.print(Panel(table, title="Kubernetes Resource Status", border_style="green"))
+    else:
+        CONSOLE.print(Panel(
+            "No resources found in the default namespace.\n"
+            "The cluster is running but no applications are deployed.",
+            title="Cluster Status - No Resources",
+            border_style="yellow"
+        ))
+    return grouped["Pod"]
+
+# Menu actions that leave the cluster untouched (see _kube_list_cached)
+_READ_ONLY_ACTIONS = frozenset(("status", "port_forward", "gen_deploy", "gen_destroy"))
+
 
 def manage_kubernetes_environment():
     """Handles all logic for the Kubernetes environment."""
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
+    # Static menus, built once rather than on every pass through the loop
+    action_choices = [
+        Choice("deploy", "Deploy now"),
+        Choice("refresh", "Refresh (restart deployments, keep data)"),
+        Choice("stop", "Stop (scale down deployments, keep data)"),
+        Choice("destroy", "Destroy now (delete everything)"),
+        Choice("status", "Check cluster status"),
+        Choice("gen_deploy", "Generate deploy script only"),
+        Choice("gen_destroy", "Generate destroy script only"),
+        Choice("build_images", "Build and load local images"),
+        Choice("start_kind", "Start local kind cluster"),
+        Choice("delete_kind", "Delete local kind cluster"),
+        Choice("port_forward", "Port-forward a service"),
+        Choice(value=None, name="Exit")
+    ]
+    scope_choices = [
+        Choice("all", "Full Stack"),
+        Choice("group", "Specific Service Groups")
+    ]
+
     CONSOLE.print(Panel("[bold]Kubernetes Environment Manager[/bold]", expand=False))
     while True:
+        action_choice = None
         try:
             action_choice = inquirer.select(
                 message="Select an action:",
-                choices=[
-                    Choice("deploy", "Deploy now"),
-                    Choice("refresh", "Refresh (restart deployments, keep data)"),
-                    Choice("stop", "Stop (scale down deployments, keep data)"),
-                    Choice("destroy", "Destroy now (delete everything)"),
-                    Choice("status", "Check cluster status"),
-                    Choice("gen_deploy", "Generate deploy script only"),
-                    Choice("gen_destroy", "Generate destroy script only"),
-                    Choice("build_images", "Build and load local images"),
-                    Choice("start_kind", "Start local kind cluster"),
-                    Choice("delete_kind", "Delete local kind cluster"),
-                    Choice("port_forward", "Port-forward a service"),
-                    Choice(value=None, name="Exit")
-                ],
+                choices=action_choices,
                 default="deploy",
             ).execute()
 
@@ -1594,23 +2737,20 @@ def manage_kubernetes_environment():
             if action_choice in ["deploy", "destroy", "refresh", "stop", "gen_deploy", "gen_destroy"]:
                 scope_choice = inquirer.select(
                     message="Select scope:",
-                    choices=[
-                        Choice("all", "Full Stack"),
-                        Choice("group", "Specific Service Groups")
-                    ],
+                    choices=scope_choices,
                     default="group"
                 ).execute()
 
                 if scope_choice == "all":
-                    selected_groups = list(K8S_SERVICE_GROUPS.keys())
+                    selected_groups = list(_ALL_GROUPS)
                 else:
-                    group_choices = [Choice(value=name, name=f"{name}: {data['description']}") for name, data in K8S_SERVICE_GROUPS.items()]
                     selected_groups = inquirer.checkbox(
                         message="Select the service groups to act on:",
-                        choices=group_choices,
+                        choices=list(_group_choices()),
                         cycle=True,
                         long_instruction="Use SPACE to select. Note: Dependencies are not automatically selected."
                     ).execute()
+                script_part = _script_name_part(selected_groups)
 
                 if action_choice in ["deploy", "gen_deploy"]:
                     # Load env from .env files if present (e.g., WOLFRAM_DOWNLOAD_URL)
@@ -1623,18 +2763,17 @@ def manage_kubernetes_environment():
                     # Skip this in production mode
                     if action_choice == "deploy" and "prod" not in K8S_DIR:
                         _build_and_load_kind_images(selected_groups)
-                    generate_k8s_deploy_script(selected_groups)
-                    if action_choice == "deploy":
-                        script_part = "all" if len(selected_groups) == len(K8S_SERVICE_GROUPS) else "_".join(g.split()[0].lower() for g in selected_groups)
-                        script_path = f"deploy_k8s_{script_part}.ps1" if _is_windows() else f"deploy_k8s_{script_part}.sh"
-                        _run_script(script_path)
+                    if action_choice == "gen_deploy":
+                        generate_k8s_deploy_script(selected_groups, script_part)
+                    elif deploy_k8s_live(selected_groups):
                         if inquirer.confirm(message="Wait for resources to become Ready?", default=True).execute():
                             wait_for_readiness()
                 elif action_choice == "refresh":
                     if not _ensure_cluster_online_or_offer_start():
                         CONSOLE.print("[yellow]Refresh cancelled: cluster is offline.[/yellow]")
                         continue
-                    refresh_k8s_deployments(selected_groups)
+                    wait = inquirer.confirm(message="Wait for restarted deployments to finish rolling out?", default=False).execute()
+                    refresh_k8s_deployments(selected_groups, wait=wait)
                 elif action_choice == "stop":
                     if not _ensure_cluster_online_or_offer_start():
                         CONSOLE.print("[yellow]Stop cancelled: cluster is offline.[/yellow]")
@@ -1648,36 +2787,17 @@ def manage_kubernetes_environment():
                     preserve_pvc = False
                     if inquirer.confirm(message="Preserve PersistentVolumeClaims (wolfram-state, etc.)?", default=True).execute():
                         preserve_pvc = True
-                    generate_k8s_destroy_script(selected_groups, preserve_pvc=preserve_pvc)
+                    generate_k8s_destroy_script(selected_groups, preserve_pvc=preserve_pvc, script_part=script_part)
                     if action_choice == "destroy":
-                        script_part = "all" if len(selected_groups) == len(K8S_SERVICE_GROUPS) else "_".join(g.split()[0].lower() for g in selected_groups)
-                        script_path = f"destroy_k8s_{script_part}.ps1" if _is_windows() else f"destroy_k8s_{script_part}.sh"
+                        script_path = f"destroy_k8s_{script_part}.ps1" if IS_WINDOWS else f"destroy_k8s_{script_part}.sh"
                         _run_script(script_path)
 
             elif action_choice == "status":
-                check_k8s_status()
-                # Offer to build images if image pull errors detected
+                pods = check_k8s_status()
+                # Offer to build images if image pull errors detected (reuses the status listing)
                 try:
-                    pods_out = subprocess.run([
-                        "kubectl", "get", "pods", "-n", "default", "-o", "json"
-                    ], check=True, capture_output=True, text=True)
-                    pods_data = json.loads(pods_out.stdout or "{}")
-                    needs_images = False
-                    for pod in pods_data.get("items", []) or []:
-                        for cs in pod.get("status", {}).get("containerStatuses", []) or []:
-                            st = cs.get("state", {})
-                            reason = None
-                            if "waiting" in st:
-                                reason = st["waiting"].get("reason")
-                            if "terminated" in st and not reason:
-                                reason = st["terminated"].get("reason")
-                            if reason in ("ErrImageNeverPull", "ImagePullBackOff", "ErrImagePull"):
-                                needs_images = True
-                                break
-                        if needs_images:
-                            break
-                    if needs_images and inquirer.confirm(message="Detected image pull errors. Build and load local images now?", default=True).execute():
-                        _build_and_load_kind_images(list(K8S_SERVICE_GROUPS.keys()))
+                    if _has_image_pull_errors(pods or []) and inquirer.confirm(message="Detected image pull errors. Build and load local images now?", default=True).execute():
+                        _build_and_load_kind_images(_ALL_GROUPS)
                 except Exception:
                     pass
 
@@ -1685,7 +2805,7 @@ def manage_kubernetes_environment():
                 if _start_kind_cluster_interactive():
                     # After cluster starts, offer to build local images
                     if inquirer.confirm(message="Build and load local images now?", default=True).execute():
-                        _build_and_load_kind_images(list(K8S_SERVICE_GROUPS.keys()))
+                        _build_and_load_kind_images(_ALL_GROUPS)
 
             elif action_choice == "delete_kind":
                 if not _kind_available():
@@ -1698,7 +2818,7 @@ def manage_kubernetes_environment():
                             kind_cmd = shutil.which("kind") or "kind"
                             # On Windows, if still not found, try known WinGet location
                             if not kind_cmd or kind_cmd == "kind":
-                                if _is_windows():
+                                if IS_WINDOWS:
                                     winget_kind_path = r"C:\Users\chris\AppData\Local\Microsoft\WinGet\Packages\Kubernetes.kind_Microsoft.Winget.Source_8wekyb3d8bbwe\kind.exe"
                                     if os.path.exists(winget_kind_path):
                                         kind_cmd = winget_kind_path
@@ -1726,70 +2846,57 @@ def manage_kubernetes_environment():
                 if not ports:
                     CONSOLE.print("[yellow]Selected service has no ports defined.[/yellow]")
                     continue
-                port_map = {f"{p.get('name') or 'port'} ({p.get('port')})->{p.get('targetPort')}": p for p in ports}
-                chosen = inquirer.select(
-                    message="Choose target port:",
-                    choices=[Choice(k, k) for k in port_map.keys()],
-                ).execute()
-                p = port_map.get(chosen)
+                if len(ports) == 1:
+                    # Most services expose a single port; no need to prompt for it
+                    p = ports[0]
+                else:
+                    # The port dict itself is the choice value, so no label -> port lookup afterwards
+                    p = inquirer.select(
+                        message="Choose target port:",
+                        choices=[Choice(p, f"{p.get('name') or 'port'} ({p.get('port')})->{p.get('targetPort')}") for p in ports],
+                    ).execute()
                 if not p:
                     continue
-                target_port = p.get("targetPort") or p.get("port")
+                # Ports arrive as ints from the API; a named targetPort (e.g. "http") can't be
+                # forwarded by number, so use the service port and let kubectl map it.
+                target_port = _parse_port(p.get("targetPort")) or _parse_port(p.get("port"))
+                if target_port is None:
+                    CONSOLE.print("[red]Selected port has no usable port number.[/red]")
+                    continue
                 default_local = str(p.get("port"))
                 local_port_str = inquirer.text(message=f"Local port (default {default_local}):", default=default_local).execute()
-                try:
-                    local_port = int(local_port_str)
-                except ValueError:
-                    CONSOLE.print("[red]Invalid local port.[/red]")
+                local_port = _parse_port(local_port_str)
+                if local_port is None:
+                    CONSOLE.print("[red]Invalid local port (expected 1-65535).[/red]")
                     continue
-                _start_port_forward(svc_choice, local_port, int(target_port))
+                _start_port_forward(svc_choice, local_port, target_port)
                 # Offer to view logs for a related deployment/statefulset
                 if inquirer.confirm(message="Open logs for this service now?", default=False).execute():
-                    # Try to find a pod serving this service selector
-                    try:
-                        # Get service selectors
-                        svc_json = subprocess.run([
-                            "kubectl", "get", "svc", svc_choice, "-n", "default", "-o", "json"
-                        ], check=True, capture_output=True, text=True)
-                        selector = json.loads(svc_json.stdout or "{}").get("spec", {}).get("selector", {})
-                        if selector:
-                            selector_str = ",".join([f"{k}={v}" for k, v in selector.items()])
-                            # Get one pod matching selector
-                            pod_json = subprocess.run([
-                                "kubectl", "get", "pods", "-n", "default", "-l", selector_str, "-o", "jsonpath={.items[0].metadata.name}"
-                            ], check=True, capture_output=True, text=True)
-                            pod_name = (pod_json.stdout or "").strip()
-                            if pod_name:
-                                # Stream logs (non-blocking user can Ctrl+C)
-                                CONSOLE.print(f"[cyan]Streaming logs for pod {pod_name} (Press Ctrl+C to stop)...[/cyan]")
-                                try:
-                                    subprocess.run(["kubectl", "logs", "-f", pod_name, "-n", "default"])  # interactive
-                                except KeyboardInterrupt:
-                                    pass
-                            else:
-                                CONSOLE.print("[yellow]No pod found for service selector.[/yellow]")
-                        else:
-                            CONSOLE.print("[yellow]Service has no selector; cannot find backing pod.[/yellow]")
-                    except subprocess.CalledProcessError:
-                        CONSOLE.print("[red]Failed to fetch service or pod information.[/red]")
+                    # The selector came with the service listing; kubectl resolves and follows the pods.
+                    selector = svc.get("selector") or {}
+                    if not selector:
+                        CONSOLE.print("[yellow]Service has no selector; cannot find backing pod.[/yellow]")
+                        continue
+                    selector_str = _selector_string(tuple(selector.items()))
+                    CONSOLE.print(f"[cyan]Streaming logs for pods matching {selector_str} (Press Ctrl+C to stop)...[/cyan]")
+                    _follow_logs([
+                        _KUBECTL, "logs", "-f", "-l", selector_str, "-n", "default",
+                        "--max-log-requests=10", "--prefix=true",
+                    ], f"logs: {svc_choice}")
 
             elif action_choice == "build_images":
                 # Choose scope similar to deploy/destroy
                 scope_choice = inquirer.select(
                     message="Select scope:",
-                    choices=[
-                        Choice("all", "Full Stack"),
-                        Choice("group", "Specific Service Groups")
-                    ],
+                    choices=scope_choices,
                     default="all"
                 ).execute()
                 if scope_choice == "all":
-                    selected_groups = list(K8S_SERVICE_GROUPS.keys())
+                    selected_groups = _ALL_GROUPS
                 else:
-                    group_choices = [Choice(value=name, name=f"{name}: {data['description']}") for name, data in K8S_SERVICE_GROUPS.items()]
                     selected_groups = inquirer.checkbox(
                         message="Select the service groups to build images for:",
-                        choices=group_choices,
+                        choices=list(_group_choices()),
                         cycle=True,
                     ).execute()
                 _build_and_load_kind_images(selected_groups)
@@ -1798,15 +2905,24 @@ def manage_kubernetes_environment():
             CONSOLE.print("\n[yellow]Operation cancelled by user.[/yellow]")
             break
         except Exception as e:
+            _invalidate_cluster_online_cache()
+            _invalidate_kube_list_cache()
             CONSOLE.print(f"\n[red]An error occurred: {e}[/red]")
             if not inquirer.confirm(message="Continue with the menu?", default=True).execute():
                 break
+        finally:
+            # Anything but a read-only action may have changed what the pickers list.
+            if action_choice not in _READ_ONLY_ACTIONS:
+                _invalidate_kube_list_cache()
 
 # --- Main Entry Point ---
 
 def main():
     """Main function to run the control center."""
     global K8S_DIR
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
     try:
         CONSOLE.print(Panel("[bold green]EnginEdge Service Control Center[/bold green]", expand=False))
         # Top-level mode selection
@@ -1820,6 +2936,10 @@ def main():
             ],
             default="k8s",
         ).execute()
+        # Every Kubernetes action shells out to kubectl at some point; stop here instead.
+        if mode in ("k8s", "prod") and not _kubectl_available():
+            _print_missing_kubectl()
+            return
         if mode == "k8s":
             manage_kubernetes_environment()
         elif mode == "prod":
@@ -1834,6 +2954,9 @@ def main():
     except Exception as e:
         CONSOLE.print(f"\n[red]Fatal error: {e}[/red]")
         sys.exit(1)
+    finally:
+        # Leave with the menu rather than at interpreter exit (atexit stays as a backstop).
+        _stop_kubectl_proxy()
 
 if __name__ == "__main__":
     main()